@@ -24,13 +24,18 @@ import re
 import shutil
 import subprocess
 import tempfile
-import unicodedata
 import webbrowser
 import threading
 import time
 import atexit
 import json
 import io
+import mmap
+import hashlib
+import html
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
 from pathlib import Path
 from typing import Optional, Dict, Any, Tuple, List
 
@@ -45,35 +50,21 @@ except ImportError:
     HAS_DND = False
     print("[WARNING] tkinterdnd2 not available, drag and drop disabled")
 
-# Markdown processing
-try:
-    import markdown
-    from markdown.extensions import codehilite, tables, toc, fenced_code
-    MARKDOWN_AVAILABLE = True
-except ImportError:
-    MARKDOWN_AVAILABLE = False
+# Markdown processing (imported lazily by _get_md on the first conversion)
+MARKDOWN_AVAILABLE = importlib.util.find_spec('markdown') is not None
+if not MARKDOWN_AVAILABLE:
     print("[WARNING] 'markdown' library not found. Install with: pip install markdown")
     print("[WARNING] Tool will start but markdown conversion will be disabled.")
 
-# PDF generation with ReportLab
-try:
-    from reportlab.lib.pagesizes import letter, A4, landscape, portrait
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Preformatted
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib import colors
-    from reportlab.lib.units import inch
-    from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
-    from reportlab.pdfgen import canvas
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
+# PDF generation with ReportLab (imported lazily in markdown_to_pdf_reportlab)
+REPORTLAB_AVAILABLE = importlib.util.find_spec('reportlab') is not None
+if not REPORTLAB_AVAILABLE:
     print("[INFO] 'reportlab' not found. PDF export will be limited.")
 
 # WeasyPrint (optional, lazy import)
 weasyprint = None
 WEASYPRINT_AVAILABLE = False
+_WEASYPRINT_CHECKED = False  # Import attempted once; the result is kept in WEASYPRINT_AVAILABLE
 
 def _setup_weasyprint_dll_directories():
     """Setup GTK DLL directories for WeasyPrint on Windows (Feature 6)"""
@@ -150,10 +141,11 @@ def _setup_weasyprint_dll_directories():
 
 def _try_import_weasyprint():
     """Safely try to import WeasyPrint only when needed (Feature 6)"""
-    global weasyprint, WEASYPRINT_AVAILABLE
+    global weasyprint, WEASYPRINT_AVAILABLE, _WEASYPRINT_CHECKED
     
-    if WEASYPRINT_AVAILABLE:
-        return True
+    if _WEASYPRINT_CHECKED:
+        return WEASYPRINT_AVAILABLE
+    _WEASYPRINT_CHECKED = True
     
     # Setup DLL directories for Windows
     _setup_weasyprint_dll_directories()
@@ -173,71 +165,73 @@ def _try_import_weasyprint():
         WEASYPRINT_AVAILABLE = False
         return False
 
-# Embedded HTML browser widget support
-try:
-    from tkinterweb import HtmlFrame
-    TKINTERWEB_AVAILABLE = True
-except ImportError:
-    TKINTERWEB_AVAILABLE = False
+# Embedded HTML browser widget support (imported when the preview widget is created)
+TKINTERWEB_AVAILABLE = importlib.util.find_spec('tkinterweb') is not None
+if not TKINTERWEB_AVAILABLE:
     print("[INFO] tkinterweb not available. Using text preview instead.")
 
-# DOCX support
-try:
-    from docx import Document
-    from docx.shared import Inches, Pt
-    from docx.enum.style import WD_STYLE_TYPE
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.shared import RGBColor
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+# DOCX support (imported lazily in markdown_to_docx and its helpers)
+DOCX_AVAILABLE = importlib.util.find_spec('docx') is not None
+if not DOCX_AVAILABLE:
     print("[WARNING] 'python-docx' not found. DOCX export disabled.")
 
 # HTML to text conversion (optional)
-try:
-    import html2text
-    HTML2TEXT_AVAILABLE = True
-except ImportError:
-    HTML2TEXT_AVAILABLE = False
+HTML2TEXT_AVAILABLE = importlib.util.find_spec('html2text') is not None
 
 
 # ============================================================================
 # Encoding Detection
 # ============================================================================
 
+# Files above this size are decoded straight from a memory map instead of a read() copy
+_MMAP_MIN_SIZE = 1024 * 1024
+
+
 def _read_file_with_encoding_detection(file_path):
     """Read file with automatic encoding detection"""
-    # First, check for BOM (Byte Order Mark) to detect UTF-16/UTF-8-BOM
+    # Read the bytes once; every encoding attempt decodes the same buffer
     with open(file_path, 'rb') as f:
-        first_bytes = f.read(4)
-        
-        # Check for UTF-16 BOMs
-        if first_bytes.startswith(b'\xff\xfe'):
-            # UTF-16 LE
-            with open(file_path, 'r', encoding='utf-16-le') as f:
-                return f.read()
-        elif first_bytes.startswith(b'\xfe\xff'):
-            # UTF-16 BE
-            with open(file_path, 'r', encoding='utf-16-be') as f:
-                return f.read()
-        elif first_bytes.startswith(b'\xef\xbb\xbf'):
-            # UTF-8 with BOM
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                return f.read()
+        if os.fstat(f.fileno()).st_size > _MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _decode_file_bytes(data)
+        return _decode_file_bytes(f.read())
+
+
+def _decode_file_bytes(data):
+    """Decode file content with BOM/fallback encoding detection and universal newlines"""
+    # First, check for BOM (Byte Order Mark) to detect UTF-16/UTF-8-BOM
+    first_bytes = data[:4]
+    
+    # Check for UTF-16 BOMs
+    if first_bytes.startswith(b'\xff\xfe'):
+        # UTF-16 LE
+        return _decode_text(data, 'utf-16-le')
+    elif first_bytes.startswith(b'\xfe\xff'):
+        # UTF-16 BE
+        return _decode_text(data, 'utf-16-be')
+    elif first_bytes.startswith(b'\xef\xbb\xbf'):
+        # UTF-8 with BOM
+        return _decode_text(data, 'utf-8-sig')
     
     # Try common encodings in order
     encodings_to_try = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252', 'iso-8859-1']
     
     for encoding in encodings_to_try:
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                return f.read()
+            return _decode_text(data, encoding)
         except (UnicodeDecodeError, LookupError):
             continue
     
     # Last resort: read with error handling (replace invalid chars)
-    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-        return f.read()
+    return _decode_text(data, 'utf-8', errors='replace')
+
+
+def _decode_text(data, encoding, errors='strict'):
+    """Decode bytes like a text-mode open() would (CRLF and CR line endings become LF)"""
+    text = str(data, encoding, errors)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 
 # ============================================================================
@@ -373,10 +367,343 @@ class UISpacing:
     XXL = 30
 
 
+# ============================================================================
+# Compiled Regular Expressions (shared by all converter instances)
+# ============================================================================
+
+# Markdown preprocessing
+_HR_LINE_RE = re.compile(r'^(?:-{3,}|\*{3,})$', re.MULTILINE)
+_EXCESS_NEWLINES_RE = re.compile(r'\n{4,}')
+
+# Page breaks
+_PAGE_BREAK_DIV_RE = re.compile(r'<div[^>]*style="[^"]*page-break[^"]*"[^>]*></div>', re.IGNORECASE)
+_PAGEBREAK_COMMENT_RE = re.compile(r'<!--\s*PAGEBREAK\s*-->', re.IGNORECASE)
+_H2_ELEMENT_RE = re.compile(r'<h2[^>]*>(.*?)</h2>')
+_NUMBERED_HEADING_RE = re.compile(r'^\d+\.')
+
+# HTML post-processing: opening/closing list and table tags (lists may carry start="N")
+_CONTAINER_TAG_RE = re.compile(r'<(/?)(ol|ul|table)\b[^>]*>')
+_CONTAINER_DIV = {
+    'table': '<div class="table-container">',
+    'ul': '<div class="list-container">',
+    'ol': '<div class="list-container">',
+}
+
+# Inline markdown (titles, citations, ReportLab/DOCX text runs)
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_STAR_RE = re.compile(r'\*(.*?)\*')
+_ITALIC_RE = re.compile(r'(?<!\*)\*([^*]+)\*(?!\*)')
+_CODE_RE = re.compile(r'`([^`]+)`')
+_CODE_LAZY_RE = re.compile(r'`(.*?)`')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_CITATION_RE = re.compile(r'\[cite_start\](.*?)\[cite:\s*([^\]]+)\]', re.DOTALL)
+_H1_LINE_RE = re.compile(r'^[^\S\n]*# (.*)$', re.MULTILINE)
+_TITLE_INLINE_RE = re.compile(r'\*\*(.*?)\*\*|\*(.*?)\*|`(.*?)`')
+_TITLE_CLEAN_RE = re.compile(r'[^\w\s\-\.,:;!?()\[\]]+')
+_HEADING_MARKUP_RE = re.compile(r'[#*`]+')
+
+
+def _inline_markup_text(match):
+    """Return the text inside whichever markup group _TITLE_INLINE_RE matched"""
+    return match.group(1) or match.group(2) or match.group(3) or ''
+
+
+# Any character that _apply_text_formatting would format or escape
+_FORMAT_META_RE = re.compile(r'[*`\[&<>]')
+
+# ReportLab paragraph markup kept through escaping (split() puts the tags at odd indices)
+_REPORTLAB_TAGS = ('<b>', '</b>', '<i>', '</i>', '<u>', '</u>', '<font name="Courier">', '</font>')
+_REPORTLAB_TAG_RE = re.compile('(' + '|'.join(map(re.escape, _REPORTLAB_TAGS)) + ')')
+
+# Line-level markdown (ReportLab/DOCX builders)
+_ORDERED_LIST_RE = re.compile(r'^(\d+)\.\s(.+)')
+# Whole table separator row: every cell between pipes holds only dashes, colons and spaces
+_SEP_ROW_RE = re.compile(r'\|(?:\s*[\-:][\s\-:]*\|)+[^|]*')
+
+# DOCX writer
+_ANCHOR_UNSAFE_RE = re.compile(r'[^A-Za-z0-9_-]+')
+_HEADING_ANCHOR_RE = re.compile(r'^(.*)\s*\{#([A-Za-z0-9_-]+)\}\s*$')
+_DOUBLE_BRACKET_LINK_RE = re.compile(r'\[\[([^\]]+)\]\]\(([^)]+)\)')
+_SINGLE_BRACKET_LINK_RE = re.compile(r'(?<!\[)\[([^\]]+)\]\(([^)]+)\)(?!\])')
+_DOCX_INLINE_SPLIT_RE = re.compile(r'(\*\*.*?\*\*|_.*?_|`.*?`)')
+
+# Emoji replacements for ReportLab when icons are not kept ('⚠' also covers '⚠️';
+# the trailing variation selector was never stripped before either)
+_EMOJI_TRANSLATE_TABLE = str.maketrans({
+    '✅': '✓', '❌': '✗', '⚠': '!',
+    '☐': '[ ]', '□': '[ ]',
+    '📝': None, '📄': None, '🚀': None, '💡': None, '🎯': None,
+    '📊': None, '📋': None, '🔍': None, '⭐': None, '✨': None,
+})
+
+# Icon replacements for HTML printed through the browser (same '⚠️' caveat as above)
+_PRINT_ICON_TRANSLATE_TABLE = str.maketrans({
+    '✅': '✓', '❌': '✗', '⚠': '!',
+    '☐': '[ ]', '□': '[ ]',
+    '✨': None, '📍': None, '📄': None, '📝': None,
+})
+
+# Text preview
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+
+
 # ============================================================================
 # Markdown Converter Core Logic
 # ============================================================================
 
+# Static pieces of the HTML document around the title, CSS and body
+_HTML_DOC_START = """<!DOCTYPE html>
+<html lang="de">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>"""
+_HTML_DOC_AFTER_TITLE = """</title>
+    """
+_HTML_DOC_AFTER_CSS = """
+</head>
+<body>
+    <div class="container">
+        """
+_HTML_DOC_END = """
+    </div>
+</body>
+</html>"""
+
+# Chromium/Edge executable for browser PDF export (_UNSET until first probed, None if missing)
+_UNSET = object()
+_CHROMIUM_PATH = _UNSET
+
+# Headless print flags shared by every browser PDF export
+_CHROMIUM_BASE_ARGS = (
+    "--headless=new",
+    "--disable-gpu",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-extensions",
+    "--disable-dev-shm-usage",
+    "--allow-file-access-from-files",
+    "--disable-web-security",
+    "--run-all-compositor-stages-before-draw",
+    "--virtual-time-budget=8000",
+    "--no-pdf-header-footer",
+)
+
+# ReportLab TableStyle for markdown tables, per header font name (built on first table)
+_REPORTLAB_TABLE_STYLES = {}
+
+# ReportLab fonts (registered on the first PDF export) and the paragraph styles built on them
+_REPORTLAB_FONT_NAMES = None
+_REPORTLAB_PARAGRAPH_STYLES = {}
+
+
+def _register_reportlab_fonts() -> Tuple[str, str, str]:
+    """Register the Windows Unicode fonts with ReportLab once; return (base, bold, mono) font names"""
+    global _REPORTLAB_FONT_NAMES
+    if _REPORTLAB_FONT_NAMES is not None:
+        return _REPORTLAB_FONT_NAMES
+    
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    
+    base_font = "Helvetica"
+    bold_font = "Helvetica-Bold"
+    mono_font = "Courier"
+    
+    try:
+        segoe = r"c:\windows\fonts\segoeui.ttf"
+        segoe_bold = r"c:\windows\fonts\segoeuib.ttf"
+        consola = r"c:\windows\fonts\consola.ttf"
+        # Try to register Segoe UI with Unicode support
+        if os.path.exists(segoe):
+            try:
+                # Register with Unicode support (subfontIndex=0 enables full Unicode)
+                pdfmetrics.registerFont(TTFont("SegoeUI", segoe, subfontIndex=0))
+                base_font = "SegoeUI"
+            except Exception:
+                # Fallback to standard registration
+                pdfmetrics.registerFont(TTFont("SegoeUI", segoe))
+                base_font = "SegoeUI"
+        if os.path.exists(segoe_bold):
+            try:
+                pdfmetrics.registerFont(TTFont("SegoeUI-Bold", segoe_bold, subfontIndex=0))
+                bold_font = "SegoeUI-Bold"
+            except Exception:
+                pdfmetrics.registerFont(TTFont("SegoeUI-Bold", segoe_bold))
+                bold_font = "SegoeUI-Bold"
+        if os.path.exists(consola):
+            try:
+                pdfmetrics.registerFont(TTFont("Consolas", consola, subfontIndex=0))
+                mono_font = "Consolas"
+            except Exception:
+                pdfmetrics.registerFont(TTFont("Consolas", consola))
+                mono_font = "Consolas"
+    except Exception:
+        pass
+    
+    _REPORTLAB_FONT_NAMES = (base_font, bold_font, mono_font)
+    return _REPORTLAB_FONT_NAMES
+
+
+def _reportlab_paragraph_styles(base_font: str, bold_font: str, mono_font: str) -> tuple:
+    """Return the (body, title, heading, code) ParagraphStyles for these fonts, built once"""
+    key = (base_font, bold_font, mono_font)
+    cached = _REPORTLAB_PARAGRAPH_STYLES.get(key)
+    if cached is not None:
+        return cached
+    
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_JUSTIFY
+    
+    styles = getSampleStyleSheet()
+    
+    body_style = ParagraphStyle(
+        'Body',
+        parent=styles['Normal'],
+        fontName=base_font,
+        fontSize=11,
+        leading=14,
+        textColor=colors.HexColor('#2c3e50'),
+        alignment=TA_JUSTIFY,  # Justified text for better readability
+    )
+    
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        textColor=colors.HexColor('#2c3e50'),
+        fontName=bold_font
+    )
+    
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=16,
+        spaceAfter=12,
+        textColor=colors.HexColor('#2c3e50'),
+        fontName=bold_font
+    )
+    
+    code_style = ParagraphStyle(
+        'CodeStyle',
+        parent=styles['Code'],
+        fontSize=9,
+        fontName=mono_font,
+        backgroundColor=colors.HexColor('#f4f4f4'),
+        borderColor=colors.HexColor('#e9ecef'),
+        borderWidth=1,
+        borderPadding=10,
+        leftIndent=20,
+        rightIndent=20,
+        leading=12,
+        spaceAfter=12
+    )
+    
+    cached = (body_style, title_style, heading_style, code_style)
+    _REPORTLAB_PARAGRAPH_STYLES[key] = cached
+    return cached
+
+# Chromium profile directories kept warm between browser PDF exports. A profile can only be
+# used by one Chromium process at a time, so concurrent exports each take their own.
+_CHROMIUM_PROFILES_FREE: List[str] = []
+_CHROMIUM_PROFILES_ALL: List[str] = []
+_CHROMIUM_PROFILES_LOCK = threading.Lock()
+
+
+def _acquire_chromium_profile() -> str:
+    """Take an idle Chromium profile directory, creating one if none is free"""
+    with _CHROMIUM_PROFILES_LOCK:
+        if _CHROMIUM_PROFILES_FREE:
+            return _CHROMIUM_PROFILES_FREE.pop()
+        profile_dir = tempfile.mkdtemp(prefix="md_converter_chromium_profile_")
+        if not _CHROMIUM_PROFILES_ALL:
+            atexit.register(_remove_chromium_profiles)
+        _CHROMIUM_PROFILES_ALL.append(profile_dir)
+        return profile_dir
+
+
+def _release_chromium_profile(profile_dir: str):
+    """Hand a Chromium profile directory back for the next export"""
+    with _CHROMIUM_PROFILES_LOCK:
+        _CHROMIUM_PROFILES_FREE.append(profile_dir)
+
+
+def _remove_chromium_profiles():
+    """Delete all Chromium profile directories (registered with atexit)"""
+    for profile_dir in _CHROMIUM_PROFILES_ALL:
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+# Rendered documents kept per converter by markdown_to_html
+_HTML_CACHE_SIZE = 32
+
+# Preset CSS + Gemini citation CSS per preset name, built on first use
+_FULL_CSS_BY_PRESET = {}
+
+# One markdown.Markdown per process - building the extension pipeline is the
+# expensive part. Conversions run on the Tk thread (exports) and on the preview
+# worker, so the instance is shared under a lock rather than built per thread
+_SHARED_MD = None
+_SHARED_MD_LOCK = threading.Lock()
+
+
+def _get_md():
+    """Return the shared markdown.Markdown instance, creating it on first use"""
+    global _SHARED_MD
+    with _SHARED_MD_LOCK:
+        if _SHARED_MD is None:
+            import markdown
+            _SHARED_MD = markdown.Markdown(
+                extensions=[
+                    'codehilite',
+                    'tables', 
+                    'toc',
+                    'fenced_code',
+                    'nl2br',
+                    'sane_lists'
+                ],
+                extension_configs={
+                    'codehilite': {
+                        'css_class': 'highlight',
+                        'use_pygments': True
+                    }
+                }
+            )
+        return _SHARED_MD
+
+
+def _iter_md_lines(md_content: str):
+    """Yield the lines of md_content exactly like md_content.split('\n'), one slice at a time"""
+    pos = 0
+    find = md_content.find
+    while (end := find('\n', pos)) != -1:
+        yield md_content[pos:end]
+        pos = end + 1
+    yield md_content[pos:]
+
+
+class _MdLineCursor:
+    """Forward-only cursor over markdown lines with one line of look-ahead"""
+    
+    def __init__(self, md_content: str):
+        self._lines = _iter_md_lines(md_content)
+        self._ahead = None
+    
+    def peek(self) -> Optional[str]:
+        """Return the next line without consuming it (None at the end)"""
+        if self._ahead is None:
+            self._ahead = next(self._lines, None)
+        return self._ahead
+    
+    def next(self) -> Optional[str]:
+        """Consume and return the next line (None at the end)"""
+        line = self.peek()
+        self._ahead = None
+        return line
+
+
 class MarkdownConverter:
     """Core markdown conversion logic"""
     
@@ -386,22 +713,22 @@ class MarkdownConverter:
         
         self.css_preset = css_preset
         self.settings = settings_manager or SettingsManager()
-        self.md = markdown.Markdown(
-            extensions=[
-                'codehilite',
-                'tables', 
-                'toc',
-                'fenced_code',
-                'nl2br',
-                'sane_lists'
-            ],
-            extension_configs={
-                'codehilite': {
-                    'css_class': 'highlight',
-                    'use_pygments': True
-                }
-            }
-        )
+        # Shared by all converters (reset() before each convert() under the lock), see _get_md()
+        self._md_lock = _SHARED_MD_LOCK
+        # Recently rendered HTML documents, keyed by content digest + render options (LRU order)
+        self._html_cache = {}
+        self._html_cache_lock = threading.Lock()
+    
+    @property
+    def css_preset(self) -> str:
+        """Name of the CSS preset used for generated HTML"""
+        return self._css_preset
+    
+    @css_preset.setter
+    def css_preset(self, preset_name: str):
+        # Resolve the preset's full <style> block once, not on every conversion
+        self._css_preset = preset_name
+        self._css_block = self._get_full_css(preset_name)
     
     def preprocess_markdown(self, md_content: str) -> str:
         """Preprocess markdown content (Feature 3 - optional)"""
@@ -409,11 +736,10 @@ class MarkdownConverter:
             return md_content
         
         # Remove horizontal rules (---) before processing
-        md_content = re.sub(r'^---+$', '', md_content, flags=re.MULTILINE)
-        md_content = re.sub(r'^\*\*\*+$', '', md_content, flags=re.MULTILINE)
+        md_content = _HR_LINE_RE.sub('', md_content)
         
         # Normalize excessive line breaks (max 2 consecutive empty lines)
-        md_content = re.sub(r'\n{4,}', '\n\n\n', md_content)
+        md_content = _EXCESS_NEWLINES_RE.sub('\n\n\n', md_content)
         
         return md_content
     
@@ -423,44 +749,44 @@ class MarkdownConverter:
             return md_content, []
         
         page_break_markers = []
-        page_break_pattern = r'<div[^>]*style="[^"]*page-break[^"]*"[^>]*></div>'
         
         def replace_page_break(match):
             marker = f"<!-- PAGEBREAK_{len(page_break_markers)} -->"
             page_break_markers.append(match.group(0))
             return marker
         
+        def replace_simple_page_break(match):
+            marker = f"<!-- PAGEBREAK_{len(page_break_markers)} -->"
+            page_break_markers.append('<div style="page-break-before: always;"></div>')
+            return marker
+        
         # Replace page breaks with HTML comment placeholders before markdown conversion
-        md_content_processed = re.sub(page_break_pattern, replace_page_break, md_content, flags=re.IGNORECASE)
+        md_content_processed = _PAGE_BREAK_DIV_RE.sub(replace_page_break, md_content)
         
         # Also handle simple <!-- PAGEBREAK --> comments
-        simple_pagebreak_pattern = r'<!--\s*PAGEBREAK\s*-->'
-        simple_pagebreak_count = len(re.findall(simple_pagebreak_pattern, md_content_processed, re.IGNORECASE))
-        for i in range(simple_pagebreak_count):
-            marker = f"<!-- PAGEBREAK_{len(page_break_markers)} -->"
-            page_break_markers.append('<div style="page-break-before: always;"></div>')
-            md_content_processed = re.sub(simple_pagebreak_pattern, marker, md_content_processed, count=1, flags=re.IGNORECASE)
+        md_content_processed = _PAGEBREAK_COMMENT_RE.sub(replace_simple_page_break, md_content_processed)
         
         return md_content_processed, page_break_markers
         
     def extract_title_from_markdown(self, md_content: str) -> str:
         """Extract title from markdown content (first H1 header)"""
-        lines = md_content.strip().split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith('# ') and not line.startswith('## '):
-                title = line[2:].strip()
-                title = re.sub(r'\*\*(.*?)\*\*', r'\1', title)
-                title = re.sub(r'\*(.*?)\*', r'\1', title)
-                title = re.sub(r'`(.*?)`', r'\1', title)
-                title = re.sub(r'[^\w\s\-\.,:;!?()\[\]]+', '', title).strip()
-                if title:
-                    return title
-        
-        first_line = lines[0].strip() if lines else ""
+        for match in _H1_LINE_RE.finditer(md_content):
+            title = self._clean_title_text(match.group(1))
+            if title:
+                return title
+        
+        return self._title_from_first_line(md_content)
+    
+    def _clean_title_text(self, text: str) -> str:
+        """Strip inline markdown and unusual symbols from H1 text"""
+        title = _TITLE_INLINE_RE.sub(_inline_markup_text, text.strip())
+        return _TITLE_CLEAN_RE.sub('', title).strip()
+    
+    def _title_from_first_line(self, md_content: str) -> str:
+        """Fallback title for documents without a usable H1 header"""
+        first_line = md_content.lstrip().partition('\n')[0].strip()
         if first_line and not first_line.startswith(('```', '---', '>')):
-            title = re.sub(r'[#*`]+', '', first_line).strip()
+            title = _HEADING_MARKUP_RE.sub('', first_line).strip()
             if len(title) > 3 and len(title) < 80:
                 return title
         
@@ -468,45 +794,79 @@ class MarkdownConverter:
     
     def process_gemini_citations(self, md_content: str) -> str:
         """Process Gemini citation format: [cite_start]text[cite: numbers]"""
-        citation_pattern = r'\[cite_start\](.*?)\[cite:\s*([^\]]+)\]'
+        if '[cite_start]' not in md_content:
+            return md_content
         
         def replace_citation(match):
             text = match.group(1)
             return f'<span class="citation">{text}</span>'
         
-        return re.sub(citation_pattern, replace_citation, md_content, flags=re.DOTALL)
+        return _CITATION_RE.sub(replace_citation, md_content)
     
     def markdown_to_html(self, md_content: str) -> str:
         """Convert markdown to styled HTML"""
         if not MARKDOWN_AVAILABLE:
             raise ImportError("markdown library is not installed")
         
+        cache_key = self._html_cache_key(md_content)
+        with self._html_cache_lock:
+            full_html = self._html_cache.pop(cache_key, None)
+            if full_html is not None:
+                self._html_cache[cache_key] = full_html
+                return full_html
+        
         # Preprocess markdown (Feature 3)
         md_content = self.preprocess_markdown(md_content)
+        document_title = self.extract_title_from_markdown(md_content)
+        full_html = self._wrap_shell(self._render_body(md_content), document_title)
         
+        with self._html_cache_lock:
+            self._html_cache[cache_key] = full_html
+            if len(self._html_cache) > _HTML_CACHE_SIZE:
+                del self._html_cache[next(iter(self._html_cache))]
+        return full_html
+    
+    def _html_cache_key(self, md_content: str) -> tuple:
+        """Build the markdown_to_html cache key from the content and every option that shapes the HTML"""
+        skip_words = self.settings.get('skip_page_break_for', ['einleitung', 'zusammenfassung'])
+        return (
+            hashlib.blake2b(md_content.encode('utf-8'), digest_size=16).digest(),
+            self._css_preset,
+            self.settings.get('preprocessing_enabled', True),
+            self.settings.get('page_breaks_enabled', True),
+            self.settings.get('auto_page_break_h2', True),
+            tuple(skip_words),
+        )
+    
+    def _render_body(self, md_content: str) -> str:
+        """Convert (preprocessed) markdown to an HTML body fragment"""
         # Process page breaks (Feature 2)
         md_content, page_break_markers = self.process_page_breaks(md_content)
-        
-        document_title = self.extract_title_from_markdown(md_content)
         md_content = self.process_gemini_citations(md_content)
         
-        self.md.reset()
-        html_body = self.md.convert(md_content)
+        # The preview converts in a worker thread while exports run in the main thread
+        md = _get_md()
+        with self._md_lock:
+            md.reset()
+            html_body = md.convert(md_content)
         
         # Restore page breaks in HTML
         for i, marker in enumerate([f"<!-- PAGEBREAK_{j} -->" for j in range(len(page_break_markers))]):
             if marker in html_body:
                 html_body = html_body.replace(marker, page_break_markers[i])
         
+        return html_body
+    
+    def _wrap_shell(self, html_body: str, document_title: str) -> str:
+        """Finish an HTML body and wrap it in the styled HTML document"""
         # Add automatic page breaks before numbered H2 headings (Feature 2)
         if self.settings.get('auto_page_break_h2', True):
-            h2_pattern = r'<h2[^>]*>(.*?)</h2>'
             h2_matches = []
-            for match in re.finditer(h2_pattern, html_body):
+            skip_words = self.settings.get('skip_page_break_for', ['einleitung', 'zusammenfassung'])
+            for match in _H2_ELEMENT_RE.finditer(html_body):
                 heading_text = match.group(1).strip()
                 # Only add page break for main chapters (starting with number and dot)
-                skip_words = self.settings.get('skip_page_break_for', ['einleitung', 'zusammenfassung'])
-                if re.match(r'^\d+\.', heading_text) and not any(word in heading_text.lower() for word in skip_words):
+                if _NUMBERED_HEADING_RE.match(heading_text) and not any(word in heading_text.lower() for word in skip_words):
                     h2_matches.append((match.start(), heading_text))
             
             # Insert page break divs before main chapter H2s
@@ -517,42 +877,68 @@ class MarkdownConverter:
                 if 'page-break' not in before_text.lower():
                     html_body = html_body[:pos] + page_break_html + '\n' + html_body[pos:]
         
-        html_body = re.sub(r'<table>(.*?)</table>', r'<div class="table-container"><table>\1</table></div>', html_body, flags=re.DOTALL)
-        html_body = re.sub(r'<ul>(.*?)</ul>', r'<div class="list-container"><ul>\1</ul></div>', html_body, flags=re.DOTALL)
-        html_body = re.sub(r'<ol>(.*?)</ol>', r'<div class="list-container"><ol>\1</ol></div>', html_body, flags=re.DOTALL)
-        
-        # Get CSS based on selected preset (use converter's preset if available, otherwise default)
-        css_preset = getattr(self, 'css_preset', 'default')
-        css_content = self._get_css_preset(css_preset) + self._get_gemini_css()
-        
-        full_html = f"""<!DOCTYPE html>
-<html lang="de">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{document_title}</title>
-    {css_content}
-</head>
-<body>
-    <div class="container">
-        {html_body}
-    </div>
-</body>
-</html>"""
-        
-        return full_html
+        html_body = self._wrap_containers(html_body)
+        
+        return ''.join((
+            _HTML_DOC_START, document_title,
+            _HTML_DOC_AFTER_TITLE, self._css_block,
+            _HTML_DOC_AFTER_CSS, html_body,
+            _HTML_DOC_END,
+        ))
+    
+    @staticmethod
+    def _wrap_containers(html_body: str) -> str:
+        """Wrap top-level tables and lists in their container divs (nested ones are left alone)"""
+        parts = []
+        pos = 0
+        depth = 0
+        for match in _CONTAINER_TAG_RE.finditer(html_body):
+            if match.group(1):
+                if depth == 0:
+                    continue  # Stray closing tag (raw HTML) - nothing was opened for it
+                depth -= 1
+                if depth == 0:
+                    parts.append(html_body[pos:match.end()])
+                    parts.append('</div>')
+                    pos = match.end()
+            else:
+                if depth == 0:
+                    parts.append(html_body[pos:match.start()])
+                    parts.append(_CONTAINER_DIV[match.group(2)])
+                    pos = match.start()
+                depth += 1
+        if not parts:
+            return html_body
+        parts.append(html_body[pos:])
+        return ''.join(parts)
+    
+    # Preset name -> method returning that preset's <style> block
+    _CSS_PRESET_METHODS = {
+        'default': '_get_default_css_content',
+        'modern': '_get_modern_css_content',
+        'classic': '_get_classic_css_content',
+        'dark': '_get_dark_css_content',
+        'professional': '_get_professional_css_content',
+        'minimal': '_get_minimal_css_content',
+    }
     
     def _get_css_preset(self, preset_name: str = 'default') -> str:
         """Get CSS styling based on preset name"""
-        presets = {
-            'default': self._get_default_css_content(),
-            'modern': self._get_modern_css_content(),
-            'classic': self._get_classic_css_content(),
-            'dark': self._get_dark_css_content(),
-            'professional': self._get_professional_css_content(),
-            'minimal': self._get_minimal_css_content(),
-        }
-        return presets.get(preset_name, presets['default'])
+        method_name = self._CSS_PRESET_METHODS.get(preset_name, '_get_default_css_content')
+        return getattr(self, method_name)()
+    
+    def _restyle_html(self, full_html: str, from_preset: str) -> str:
+        """Swap the style block of a document rendered with from_preset for the current preset"""
+        # The style block is the first thing after the title, so the first match is the shell's
+        return full_html.replace(self._get_full_css(from_preset), self._css_block, 1)
+    
+    def _get_full_css(self, preset_name: str = 'default') -> str:
+        """Get preset CSS plus Gemini citation CSS, joined once per preset"""
+        css = _FULL_CSS_BY_PRESET.get(preset_name)
+        if css is None:
+            css = self._get_css_preset(preset_name) + self._get_gemini_css()
+            _FULL_CSS_BY_PRESET[preset_name] = css
+        return css
     
     def _get_default_css(self) -> str:
         """Get default CSS styling (legacy method, uses default preset)"""
@@ -1573,19 +1959,12 @@ a:hover {
     def _replace_emojis_for_pdf(self, text: str, keep_emojis: bool = True) -> str:
         """Replace emojis with PDF-safe equivalents or preserve UTF-8 icons"""
         # If keep_emojis is True, preserve all Unicode characters (including UTF-8 icons)
-        if keep_emojis:
+        # Pure ASCII text cannot contain any of the replaced emojis
+        if keep_emojis or text.isascii():
             return text
         
         # Only replace specific emojis if keep_emojis is False
-        emoji_replacements = {
-            '✅': '✓', '❌': '✗', '⚠': '!', '⚠️': '!',
-            '☐': '[ ]', '□': '[ ]',
-            '📝': '', '📄': '', '🚀': '', '💡': '', '🎯': '',
-            '📊': '', '📋': '', '🔍': '', '⭐': '', '✨': '',
-        }
-        
-        for emoji, replacement in emoji_replacements.items():
-            text = text.replace(emoji, replacement)
+        text = text.translate(_EMOJI_TRANSLATE_TABLE)
         
         # Preserve all Unicode characters (including UTF-8 icons like ✅, ⭐, 🔧, etc.)
         # ReportLab with Unicode-capable fonts (like Segoe UI) can handle these
@@ -1594,34 +1973,32 @@ a:hover {
     def _apply_text_formatting(self, text: str, keep_emojis: bool = True) -> str:
         """Apply text formatting for ReportLab"""
         text = self._replace_emojis_for_pdf(text, keep_emojis=keep_emojis)
+        # Plain prose: nothing to format and nothing to escape
+        if not _FORMAT_META_RE.search(text):
+            return text
         
-        citation_pattern = r'\[cite_start\](.*?)\[cite:\s*([^\]]+)\]'
         def replace_citation(match):
             text = match.group(1)
-            text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
-            text = re.sub(r'\*(.*?)\*', r'\1', text)
+            text = _BOLD_RE.sub(r'\1', text)
+            text = _STAR_RE.sub(r'\1', text)
             return f'<b>{text}</b>'
         
-        text = re.sub(citation_pattern, replace_citation, text, flags=re.DOTALL)
-        text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', text)
-        text = re.sub(r'(?<!\*)\*([^*]+)\*(?!\*)', r'<i>\1</i>', text)
-        text = re.sub(r'`([^`]+)`', r'<font name="Courier">\1</font>', text)
-        text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'<u>\1</u>', text)
-        
-        text = text.replace('&', '&amp;')
-        text = text.replace('<', '&lt;')
-        text = text.replace('>', '&gt;')
-        
-        text = text.replace('&lt;b&gt;', '<b>')
-        text = text.replace('&lt;/b&gt;', '</b>')
-        text = text.replace('&lt;i&gt;', '<i>')
-        text = text.replace('&lt;/i&gt;', '</i>')
-        text = text.replace('&lt;u&gt;', '<u>')
-        text = text.replace('&lt;/u&gt;', '</u>')
-        text = text.replace('&lt;font name="Courier"&gt;', '<font name="Courier">')
-        text = text.replace('&lt;/font&gt;', '</font>')
-        
-        return text
+        if '[cite_start]' in text:
+            text = _CITATION_RE.sub(replace_citation, text)
+        # Sequential passes let bold nest inside italics/code/links; each only runs when
+        # its marker is present (no pass introduces another pass's marker)
+        if '*' in text:
+            text = _BOLD_RE.sub(r'<b>\1</b>', text)
+            text = _ITALIC_RE.sub(r'<i>\1</i>', text)
+        if '`' in text:
+            text = _CODE_RE.sub(r'<font name="Courier">\1</font>', text)
+        if '](' in text:
+            text = _LINK_RE.sub(r'<u>\1</u>', text)
+        
+        # Escape only the text between the ReportLab markup tags
+        parts = _REPORTLAB_TAG_RE.split(text)
+        parts[::2] = [html.escape(part, quote=False) for part in parts[::2]]
+        return ''.join(parts)
     
     def markdown_to_pdf_reportlab(
         self,
@@ -1635,40 +2012,11 @@ a:hover {
             return False
             
         try:
-            base_font = "Helvetica"
-            bold_font = "Helvetica-Bold"
-            mono_font = "Courier"
+            from reportlab.lib.pagesizes import A4, landscape, portrait
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Preformatted
+            from reportlab.lib import colors
             
-            try:
-                segoe = r"c:\windows\fonts\segoeui.ttf"
-                segoe_bold = r"c:\windows\fonts\segoeuib.ttf"
-                consola = r"c:\windows\fonts\consola.ttf"
-                # Try to register Segoe UI with Unicode support
-                if os.path.exists(segoe):
-                    try:
-                        # Register with Unicode support (subfontIndex=0 enables full Unicode)
-                        pdfmetrics.registerFont(TTFont("SegoeUI", segoe, subfontIndex=0))
-                        base_font = "SegoeUI"
-                    except Exception:
-                        # Fallback to standard registration
-                        pdfmetrics.registerFont(TTFont("SegoeUI", segoe))
-                        base_font = "SegoeUI"
-                if os.path.exists(segoe_bold):
-                    try:
-                        pdfmetrics.registerFont(TTFont("SegoeUI-Bold", segoe_bold, subfontIndex=0))
-                        bold_font = "SegoeUI-Bold"
-                    except Exception:
-                        pdfmetrics.registerFont(TTFont("SegoeUI-Bold", segoe_bold))
-                        bold_font = "SegoeUI-Bold"
-                if os.path.exists(consola):
-                    try:
-                        pdfmetrics.registerFont(TTFont("Consolas", consola, subfontIndex=0))
-                        mono_font = "Consolas"
-                    except Exception:
-                        pdfmetrics.registerFont(TTFont("Consolas", consola))
-                        mono_font = "Consolas"
-            except Exception:
-                pass
+            base_font, bold_font, mono_font = _register_reportlab_fonts()
             
             document_title = self.extract_title_from_markdown(md_content)
             
@@ -1687,170 +2035,135 @@ a:hover {
                 title=document_title
             )
             
-            styles = getSampleStyleSheet()
-            
-            body_style = ParagraphStyle(
-                'Body',
-                parent=styles['Normal'],
-                fontName=base_font,
-                fontSize=11,
-                leading=14,
-                textColor=colors.HexColor('#2c3e50'),
-                alignment=TA_JUSTIFY,  # Justified text for better readability
+            body_style, title_style, heading_style, code_style = _reportlab_paragraph_styles(
+                base_font, bold_font, mono_font
             )
             
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                spaceAfter=30,
-                textColor=colors.HexColor('#2c3e50'),
-                fontName=bold_font
-            )
+            # Repeated cells, bullets and headings are formatted once per document
+            format_cache = {}
             
-            heading_style = ParagraphStyle(
-                'CustomHeading',
-                parent=styles['Heading2'],
-                fontSize=16,
-                spaceAfter=12,
-                textColor=colors.HexColor('#2c3e50'),
-                fontName=bold_font
-            )
+            def format_text(text):
+                formatted = format_cache.get(text)
+                if formatted is None:
+                    formatted = format_cache[text] = self._apply_text_formatting(text, keep_emojis=keep_icons)
+                return formatted
             
-            code_style = ParagraphStyle(
-                'CodeStyle',
-                parent=styles['Code'],
-                fontSize=9,
-                fontName=mono_font,
-                backgroundColor=colors.HexColor('#f4f4f4'),
-                borderColor=colors.HexColor('#e9ecef'),
-                borderWidth=1,
-                borderPadding=10,
-                leftIndent=20,
-                rightIndent=20,
-                leading=12,
-                spaceAfter=12
-            )
+            empty_cells = {}
             
             story = []
-            lines = md_content.split('\n')
+            # Bound once: the loop below adds one or two flowables for nearly every line
+            append = story.append
+            extend = story.extend
+            cursor = _MdLineCursor(md_content)
             in_code_block = False
             code_lines = []
-            i = 0
             
-            while i < len(lines):
-                line = lines[i]
+            while (line := cursor.next()) is not None:
                 line_stripped = line.strip()
                 
                 if line_stripped.startswith('```'):
                     if in_code_block:
                         if code_lines:
                             code_text = '\n'.join(code_lines)
-                            safe_code = (
-                                code_text
-                                .replace('&', '&amp;')
-                                .replace('<', '&lt;')
-                                .replace('>', '&gt;')
-                            )
-                            story.append(Preformatted(safe_code, code_style))
-                            story.append(Spacer(1, 12))
+                            safe_code = html.escape(code_text, quote=False)
+                            extend((Preformatted(safe_code, code_style), Spacer(1, 12)))
                         code_lines = []
                         in_code_block = False
                     else:
                         in_code_block = True
                         code_lines = []
-                    i += 1
                     continue
                 
                 if in_code_block:
                     code_lines.append(line)
-                    i += 1
                     continue
                 
-                if line_stripped.startswith('#'):
+                # The first character decides the block type; regexes only run for digit lines
+                first = line_stripped[:1]
+                if first == '#':
                     level = len(line_stripped) - len(line_stripped.lstrip('#'))
                     text = line_stripped.lstrip('#').strip()
-                    text = self._apply_text_formatting(text, keep_emojis=keep_icons)
+                    text = format_text(text)
                     
                     if level == 1:
-                        story.append(Paragraph(text, title_style))
+                        extend((Paragraph(text, title_style), Spacer(1, 6)))
                     elif level == 2:
-                        story.append(Paragraph(text, heading_style))
+                        extend((Paragraph(text, heading_style), Spacer(1, 6)))
                     else:
-                        story.append(Paragraph(text, heading_style))
-                    story.append(Spacer(1, 6))
+                        extend((Paragraph(text, heading_style), Spacer(1, 6)))
                 
                 elif line_stripped.startswith(('- ', '* ', '+ ')):
                     text = line_stripped[2:].strip()
-                    text = self._apply_text_formatting(text, keep_emojis=keep_icons)
-                    story.append(Paragraph(f"• {text}", body_style))
+                    text = format_text(text)
+                    append(Paragraph(f"• {text}", body_style))
                 
-                elif re.match(r'^\d+\.\s', line_stripped):
-                    match = re.match(r'^(\d+)\.\s(.+)', line_stripped)
-                    if match:
-                        num, text = match.groups()
-                        text = self._apply_text_formatting(text, keep_emojis=keep_icons)
-                        story.append(Paragraph(f"{num}. {text}", body_style))
+                elif first.isdigit() and (match := _ORDERED_LIST_RE.match(line_stripped)):
+                    num, text = match.groups()
+                    text = format_text(text)
+                    append(Paragraph(f"{num}. {text}", body_style))
                 
                 # Tables - improved detection (must start with |)
-                elif line_stripped.startswith('|') and '|' in line_stripped:
+                elif first == '|':
                     table_rows = []
-                    j = i
+                    row_line = line_stripped
                     
                     # Collect all consecutive table rows
-                    while j < len(lines) and lines[j].strip().startswith('|'):
-                        row_line = lines[j].strip()
-                        # Split and clean cells
-                        cells = [cell.strip() for cell in row_line.split('|')[1:-1]]
+                    while True:
                         # Skip separator rows (only contains dashes, colons, spaces, and pipes)
-                        if cells and not all(re.match(r'^[\s\-:]+$', c) for c in cells):
-                            table_rows.append(cells)
-                        j += 1
+                        if not _SEP_ROW_RE.fullmatch(row_line):
+                            # Split and clean cells
+                            cells = [cell.strip() for cell in row_line.split('|')[1:-1]]
+                            if cells:
+                                table_rows.append(cells)
+                        next_line = cursor.peek()
+                        if next_line is None or not (row_line := next_line.strip()).startswith('|'):
+                            break
+                        cursor.next()
                     
                     if len(table_rows) > 0:
                         table_data = []
                         for row_idx, row in enumerate(table_rows):
                             if row:  # Only process non-empty rows
-                                formatted_cells = [
-                                    self._apply_text_formatting(cell, keep_emojis=keep_icons)
-                                    for cell in row
-                                ]
                                 # First row is header
-                                if row_idx == 0:
-                                    table_data.append([Paragraph(c, heading_style) for c in formatted_cells])
-                                else:
-                                    table_data.append([Paragraph(c, body_style) for c in formatted_cells])
+                                cell_style = heading_style if row_idx == 0 else body_style
+                                # Empty cells share one Paragraph per style (Table re-wraps each cell before drawing it)
+                                empty_cell = empty_cells.get(cell_style.name)
+                                if empty_cell is None:
+                                    empty_cell = empty_cells[cell_style.name] = Paragraph('', cell_style)
+                                table_data.append([
+                                    Paragraph(format_text(cell), cell_style) if cell else empty_cell
+                                    for cell in row
+                                ])
                         
                         if table_data:
                             num_cols = max(len(r) for r in table_data) if table_data else 1
                             col_widths = [doc.width / num_cols] * num_cols
                             t = Table(table_data, colWidths=col_widths, hAlign='LEFT', repeatRows=1)
-                            t.setStyle(TableStyle([
-                                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2563eb')),
-                                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                                ('FONTNAME', (0, 0), (-1, 0), bold_font),
-                                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#d0d7de')),
-                                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
-                                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                            ]))
-                            story.append(t)
-                            story.append(Spacer(1, 12))
-                    
-                    i = j - 1  # -1 because outer loop will increment
+                            # setStyle() only reads the commands, so one TableStyle serves every table
+                            table_style = _REPORTLAB_TABLE_STYLES.get(bold_font)
+                            if table_style is None:
+                                table_style = TableStyle([
+                                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2563eb')),
+                                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                                    ('FONTNAME', (0, 0), (-1, 0), bold_font),
+                                    ('FONTSIZE', (0, 0), (-1, 0), 10),
+                                    ('FONTSIZE', (0, 1), (-1, -1), 10),
+                                    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+                                    ('TOPPADDING', (0, 0), (-1, -1), 8),
+                                    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#d0d7de')),
+                                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
+                                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                                ])
+                                _REPORTLAB_TABLE_STYLES[bold_font] = table_style
+                            t.setStyle(table_style)
+                            extend((t, Spacer(1, 12)))
                 
                 elif line_stripped:
-                    text = self._apply_text_formatting(line_stripped, keep_emojis=keep_icons)
-                    story.append(Paragraph(text, body_style))
-                    story.append(Spacer(1, 6))
+                    text = format_text(line_stripped)
+                    extend((Paragraph(text, body_style), Spacer(1, 6)))
                 else:
-                    story.append(Spacer(1, 6))
-                
-                i += 1
+                    append(Spacer(1, 6))
             
             doc.build(story)
             return True
@@ -1898,7 +2211,12 @@ a:hover {
             return False
     
     def _find_chromium_for_pdf(self) -> Optional[str]:
-        """Find a Chromium-based browser executable"""
+        """Find a Chromium-based browser executable (probed once per process)"""
+        global _CHROMIUM_PATH
+        if _CHROMIUM_PATH is not _UNSET:
+            return _CHROMIUM_PATH
+        
+        _CHROMIUM_PATH = None
         candidates = [
             r"c:\program files (x86)\microsoft\edge\application\msedge.exe",
             r"c:\program files\microsoft\edge\application\msedge.exe",
@@ -1907,8 +2225,9 @@ a:hover {
         ]
         for p in candidates:
             if os.path.exists(p):
-                return p
-        return None
+                _CHROMIUM_PATH = p
+                break
+        return _CHROMIUM_PATH
     
     def html_to_pdf_browser(
         self,
@@ -1927,76 +2246,91 @@ a:hover {
             if replace_icons:
                 html_content = self._replace_icons_for_print(html_content)
             
+            # Unique file per export so parallel exports (batch_html_to_pdf) don't collide
             temp_dir = tempfile.gettempdir()
-            html_path = os.path.join(temp_dir, "md_converter_print.html")
-            with open(html_path, "w", encoding="utf-8") as f:
-                f.write(html_content)
-            
-            file_url = Path(html_path).absolute().as_uri()
-            
-            out_dir = os.path.dirname(os.path.abspath(output_path))
-            if out_dir and not os.path.exists(out_dir):
-                os.makedirs(out_dir, exist_ok=True)
-            
-            pdf_out = os.path.abspath(output_path).replace("\\", "/")
-            user_data_dir = tempfile.mkdtemp(prefix="md_converter_chromium_profile_")
-            
-            base_args = [
-                exe,
-                "--headless=new",
-                "--disable-gpu",
-                "--no-first-run",
-                "--no-default-browser-check",
-                "--disable-extensions",
-                "--disable-dev-shm-usage",
-                "--allow-file-access-from-files",
-                "--disable-web-security",
-                "--run-all-compositor-stages-before-draw",
-                "--virtual-time-budget=8000",
-                "--no-pdf-header-footer",
-                f"--user-data-dir={user_data_dir}",
-                f"--print-to-pdf={pdf_out}",
-                file_url,
-            ]
-            
+            html_file = tempfile.NamedTemporaryFile("wb", suffix=".html", prefix="md_converter_print_",
+                                                    dir=temp_dir, delete=False)
+            html_path = html_file.name
             try:
-                r = subprocess.run(base_args, capture_output=True, text=True, timeout=180)
-                if r.returncode == 0 and os.path.exists(output_path):
-                    size = os.path.getsize(output_path)
-                    if size > 20_000:
-                        return True
-                return False
+                with html_file:
+                    html_file.write(html_content.encode("utf-8"))
+                
+                file_url = Path(html_path).absolute().as_uri()
+                
+                out_dir = os.path.dirname(os.path.abspath(output_path))
+                if out_dir:
+                    os.makedirs(out_dir, exist_ok=True)
+                
+                pdf_out = os.path.abspath(output_path).replace("\\", "/")
+                user_data_dir = _acquire_chromium_profile()
+                
+                args = [
+                    exe,
+                    *_CHROMIUM_BASE_ARGS,
+                    f"--user-data-dir={user_data_dir}",
+                    f"--print-to-pdf={pdf_out}",
+                    file_url,
+                ]
+                
+                try:
+                    # Only the exit code is used - Chromium's (verbose) output is discarded, not decoded
+                    r = subprocess.run(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=180)
+                    if r.returncode != 0:
+                        return False
+                    try:
+                        return os.stat(output_path).st_size > 20_000
+                    except OSError:
+                        return False
+                finally:
+                    _release_chromium_profile(user_data_dir)
             finally:
+                # Removed on every path, including a failing makedirs or profile setup
                 try:
-                    shutil.rmtree(user_data_dir, ignore_errors=True)
-                except Exception:
+                    os.unlink(html_path)
+                except OSError:
                     pass
         except Exception:
             return False
     
+    def batch_html_to_pdf(
+        self,
+        jobs: List[Tuple[str, str]],
+        max_workers: Optional[int] = None,
+        **options,
+    ) -> List[bool]:
+        """Convert several (html_content, output_path) jobs to PDF in parallel
+        
+        Each job runs its own headless browser process, so threads are enough to keep
+        several cores busy. Extra keyword arguments are passed to html_to_pdf_browser.
+        """
+        if not jobs:
+            return []
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) // 2)
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            futures = [
+                executor.submit(self.html_to_pdf_browser, html_content, output_path, **options)
+                for html_content, output_path in jobs
+            ]
+            return [future.result() for future in futures]
+    
     def _replace_icons_for_print(self, s: str) -> str:
         """Replace emojis with PDF-safe equivalents"""
         if not s:
             return s
-        replacements = {
-            "✅": "✓", "❌": "✗", "⚠": "!", "⚠️": "!",
-            "☐": "[ ]", "□": "[ ]",
-            "✨": "", "📍": "", "📄": "", "📝": "",
-        }
-        for k, v in replacements.items():
-            s = s.replace(k, v)
-        return s
+        return s.translate(_PRINT_ICON_TRANSLATE_TABLE)
     
     def _normalize_anchor_for_docx(self, anchor: str) -> str:
         """Make anchor names safe for Word bookmarks (Feature 4)"""
-        safe = re.sub(r'[^A-Za-z0-9_-]+', '-', anchor.strip())
+        safe = _ANCHOR_UNSAFE_RE.sub('-', anchor.strip())
         if not safe or not safe[0].isalpha():
             safe = f"a-{safe}"
         return safe
     
     def _extract_heading_text_and_anchor(self, text: str):
         """Extract visible heading text and optional {#anchor} (Feature 4)"""
-        match = re.match(r'^(.*)\s*\{#([A-Za-z0-9_-]+)\}\s*$', text)
+        match = _HEADING_ANCHOR_RE.match(text)
         if match:
             return match.group(1).strip(), match.group(2).strip()
         return text.strip(), None
@@ -2109,13 +2443,10 @@ a:hover {
                 run.font.name = 'Courier New'
         
         # Match links: [[text]](url) and [text](url)
-        double_bracket_pattern = re.compile(r'\[\[([^\]]+)\]\]\(([^)]+)\)')
-        single_bracket_pattern = re.compile(r'(?<!\[)\[([^\]]+)\]\(([^)]+)\)(?!\])')
-        
         matches = []
-        for match in double_bracket_pattern.finditer(text):
+        for match in _DOUBLE_BRACKET_LINK_RE.finditer(text):
             matches.append((match.start(), match.end(), match.group(1), match.group(2), True))
-        for match in single_bracket_pattern.finditer(text):
+        for match in _SINGLE_BRACKET_LINK_RE.finditer(text):
             overlap = False
             for d_start, d_end, _, _, _ in matches:
                 if not (match.end() <= d_start or match.start() >= d_end):
@@ -2151,7 +2482,7 @@ a:hover {
         if not remaining:
             return
         
-        parts = re.split(r'(\*\*.*?\*\*|_.*?_|`.*?`)', remaining)
+        parts = _DOCX_INLINE_SPLIT_RE.split(remaining)
         for part in parts:
             if part.startswith('**') and part.endswith('**'):
                 add_run(part[2:-2], 'bold')
@@ -2174,13 +2505,19 @@ a:hover {
         language = self.settings.get('docx_language', 'de-CH')
         
         try:
+            from docx import Document
+            from docx.shared import Inches, Pt
+            
             # Preprocess markdown
             md_content = self.preprocess_markdown(md_content)
             
             doc = Document()
-            document_title = self.extract_title_from_markdown(md_content)
-            doc.core_properties.title = document_title
             doc.core_properties.author = "Markdown Converter"
+            # The title is normally the first H1 met by the line loop below; citation markup
+            # would end up in that heading text, so such documents are scanned up front
+            document_title = None
+            if '[cite_start]' in md_content:
+                document_title = self.extract_title_from_markdown(md_content)
             
             # Set default language
             if use_advanced:
@@ -2214,7 +2551,7 @@ a:hover {
             
             md_content = self.process_gemini_citations(md_content)
             
-            lines = md_content.split('\n')
+            cursor = _MdLineCursor(md_content)
             in_code_block = False
             code_lines = []
             bookmark_id = 0
@@ -2222,19 +2559,16 @@ a:hover {
             previous_was_content = False
             needs_page_break = False
             
-            i = 0
-            while i < len(lines):
-                line = lines[i]
+            while (line := cursor.next()) is not None:
                 line_stripped = line.strip()
                 
                 # Handle page breaks
-                if 'page-break' in line_stripped.lower() and 'div' in line_stripped.lower():
+                line_lower = line_stripped.lower()
+                if 'page-break' in line_lower and 'div' in line_lower:
                     needs_page_break = True
-                    i += 1
                     continue
-                if re.match(r'<!--\s*PAGEBREAK\s*-->', line_stripped, re.IGNORECASE):
+                if _PAGEBREAK_COMMENT_RE.match(line_stripped):
                     needs_page_break = True
-                    i += 1
                     continue
                 
                 if line_stripped.startswith('```'):
@@ -2252,15 +2586,15 @@ a:hover {
                     else:
                         in_code_block = True
                         code_lines = []
-                    i += 1
                     continue
                 
                 if in_code_block:
                     code_lines.append(line)
-                    i += 1
                     continue
                 
-                if line_stripped.startswith('#'):
+                # The first character decides the block type; regexes only run for digit lines
+                first = line_stripped[:1]
+                if first == '#':
                     level = len(line_stripped) - len(line_stripped.lstrip('#'))
                     heading_text_raw = line_stripped.lstrip('#').strip()
                     
@@ -2270,6 +2604,9 @@ a:hover {
                         heading_text = heading_text_raw
                         heading_anchor = None
                     
+                    if document_title is None and level == 1 and line_stripped.startswith('# '):
+                        document_title = self._clean_title_text(line_stripped[2:]) or None
+                    
                     lvl = min(level, 6)
                     p = doc.add_heading(heading_text, level=lvl)
                     
@@ -2302,8 +2639,8 @@ a:hover {
                         p.add_run(text)
                     previous_was_content = True
                 
-                elif re.match(r'^\d+\.\s', line_stripped):
-                    text = re.sub(r'^\d+\.\s', '', line_stripped)
+                elif first.isdigit() and (match := _ORDERED_LIST_RE.match(line_stripped)):
+                    text = match.group(2)
                     p = doc.add_paragraph(style='List Number')
                     if use_advanced:
                         self._add_formatted_text(p, text, anchor_map=anchor_map)
@@ -2318,9 +2655,8 @@ a:hover {
                     else:
                         p.add_run(line_stripped)
                     previous_was_content = True
-                
-                i += 1
             
+            doc.core_properties.title = document_title or self._title_from_first_line(md_content)
             doc.save(output_path)
             return True
             
@@ -2329,10 +2665,346 @@ a:hover {
             return False
 
 
+# ============================================================================
+# Text Preview Rendering
+# ============================================================================
+
+# Reference-style link/footnote definitions (these resolve across markdown blocks)
+_MD_REFERENCE_DEF_RE = re.compile(r'^ {0,3}\[[^\]]+\]:', re.MULTILINE)
+# List item and blockquote lines - these continue across blank lines (loose lists, long quotes)
+_MD_CONTAINER_LINE_RE = re.compile(r' {0,3}(?:(?P<list>(?:[*+-]|\d+[.)])(?:\s|$))|(?P<quote>>))')
+# Lines starting raw HTML or a comment - a block left open on its line runs across blank lines
+_MD_HTML_LINE_RE = re.compile(r'^ {0,3}<(!--|[a-zA-Z][a-zA-Z0-9]*)[^\n]*', re.MULTILINE)
+_HTML_VOID_TAGS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                             'link', 'meta', 'source', 'track', 'wbr'))
+# Heading ids assigned by the toc extension (made unique across the whole document)
+_HEADING_ID_RE = re.compile(r'<h[1-6][^>]*\bid="([^"]*)"')
+
+
+def _has_open_html_block(md_content: str) -> bool:
+    """Whether a raw HTML block or comment is not closed on the line that opens it"""
+    for match in _MD_HTML_LINE_RE.finditer(md_content):
+        tag = match.group(1)
+        if tag == '!--':
+            if '-->' not in match.group():
+                return True
+        elif tag.lower() not in _HTML_VOID_TAGS and f'</{tag}' not in match.group():
+            return True
+    return False
+
+
+def _split_markdown_blocks(md_content: str) -> List[str]:
+    """Split markdown into blank-line separated blocks for incremental preview rendering
+    
+    Fenced code blocks, indented continuations (nested list content, indented
+    code) and list items or quote lines separated by blank lines stay together
+    in one block.
+    """
+    blocks = []
+    current: List[str] = []
+    blank_run: List[str] = []
+    fence = None
+    block_kinds = set()  # 'list' / 'quote' when the current block contains such lines
+    
+    for line in md_content.split('\n'):
+        if fence:
+            current.append(line)
+            if line.lstrip().startswith(fence):
+                fence = None
+            continue
+        
+        if not line.strip():
+            if current:
+                blank_run.append(line)
+            continue
+        
+        container = _MD_CONTAINER_LINE_RE.match(line)
+        kind = container.lastgroup if container else None
+        if blank_run:
+            if line[0] in ' \t' or kind in block_kinds:
+                current.extend(blank_run)
+            else:
+                blocks.append('\n'.join(current))
+                current = []
+                block_kinds = set()
+            blank_run = []
+        
+        current.append(line)
+        if kind:
+            block_kinds.add(kind)
+        stripped = line.lstrip()
+        if stripped.startswith(('```', '~~~')):
+            fence = stripped[:3]
+    
+    if current:
+        blocks.append('\n'.join(current))
+    return blocks
+
+
+# Characters that make up the heading underlines in the text preview
+_SEPARATOR_CHARS = '=-·'
+_SEPARATOR_DELETE_TABLE = str.maketrans('', '', _SEPARATOR_CHARS)
+
+# Whitespace (as str.rstrip() sees it) at the end of a line
+_TRAILING_WS_RE = re.compile(r'[^\S\n]+(?=\n)')
+
+# Inline formatting boundaries emitted into the text preview (private-use characters,
+# removed from the document text so they can only come from the emitter)
+_PREVIEW_MARKER_TAGS = {'\ue000': 'bold', '\ue001': 'italic', '\ue002': 'code'}
+_PREVIEW_MARKER_RE = re.compile('[\ue000-\ue002]')
+
+_BOX_BOTTOM = '└──────────────────────────────────┘\n'
+
+# Characters outside the BMP (emoji) - Tk 8.6 counts them as two chars in "+ N chars" indices
+_NON_BMP_RE = re.compile('[\U00010000-\U0010FFFF]')
+
+
+def _format_preview_text(content: str) -> Tuple[str, Dict[str, List[str]]]:
+    """Strip inline markers from the text preview and collect Tk index pairs per formatting tag
+    
+    Returns the text to show and {tag: [start, end, start, end, ...]} for tag_add().
+    """
+    # Heading tags depend on neighbouring lines, inline tags on the rewritten line
+    tag_ranges = {"heading1": [], "heading2": [], "heading3": [], "separator": [], "code": [],
+                  "bold": [], "italic": []}
+    shown_lines = []
+    
+    # Find headings and separators in a single pass, remembering the previous line's separator
+    prev_heading_tag = None
+    in_code_block = False
+    for line_num, line in enumerate(content.split('\n'), 1):
+        shown_lines.append(line)
+        line_start = f"{line_num}.0"
+        line_end = f"{line_num}.end"
+        line_stripped = line.strip()
+        
+        # Tag separators (lines with =, -, or ·) and the heading line before them
+        heading_tag = None
+        if len(line_stripped) > 10 and not line_stripped.translate(_SEPARATOR_DELETE_TABLE):
+            if '=' in line_stripped:
+                heading_tag = "heading1"
+            elif '-' in line_stripped:
+                heading_tag = "heading2"
+            else:
+                heading_tag = "heading3"
+            tag_ranges["separator"] += (line_start, line_end)
+            if line_num > 1:
+                tag_ranges[heading_tag] += (f"{line_num-1}.0", f"{line_num-1}.end")
+        elif line_stripped and prev_heading_tag:
+            tag_ranges[prev_heading_tag] += (line_start, line_end)
+        prev_heading_tag = heading_tag
+        
+        # Tag code blocks (their content is shown verbatim)
+        if '┌─ CODE' in line or '└─' in line or (line_stripped.startswith('│') and 'CODE' in line):
+            tag_ranges["code"] += (line_start, line_end)
+            in_code_block = line.startswith('┌─ CODE')
+            continue
+        if in_code_block:
+            continue
+        
+        # Tag inline code, bold and italic between their boundary markers and strip the markers
+        if _PREVIEW_MARKER_RE.search(line):
+            parts = []
+            pos = 0
+            col = 0  # Column in the rewritten line
+            open_cols = {}  # Tag -> column where it was opened
+            for match in _PREVIEW_MARKER_RE.finditer(line):
+                parts.append(line[pos:match.start()])
+                col += match.start() - pos
+                pos = match.end()
+                tag = _PREVIEW_MARKER_TAGS[match.group()]
+                start_col = open_cols.pop(tag, None)
+                if start_col is None:
+                    open_cols[tag] = col
+                elif start_col < col:
+                    tag_ranges[tag] += (f"{line_num}.{start_col}", f"{line_num}.{col}")
+            parts.append(line[pos:])
+            shown_lines[-1] = ''.join(parts)
+    
+    return '\n'.join(shown_lines), tag_ranges
+
+
+class _PreviewEmitter(HTMLParser):
+    """Single-pass HTML to plain text converter for the text preview widget"""
+    
+    # Elements whose content is never shown in the preview
+    SKIP_TAGS = frozenset(('head', 'title', 'style', 'script'))
+    # Elements whose whitespace-only text is markup indentation, not content
+    STRUCTURAL_TAGS = frozenset(('table', 'thead', 'tbody', 'tfoot', 'tr', 'ul', 'ol'))
+    # Text emitted when an element opens and closes
+    MARKUP = {
+        'h1': ('\n\n', '\n' + '=' * 50 + '\n'),
+        'h2': ('\n\n', '\n' + '-' * 50 + '\n'),
+        'h3': ('\n\n', '\n' + '·' * 50 + '\n'),
+        'h4': ('\n', '\n'),
+        'h5': ('\n', '\n'),
+        'h6': ('\n', '\n'),
+        'pre': ('\n┌─ CODE BLOCK ─────────────────────┐\n', '\n' + _BOX_BOTTOM),
+        'ul': ('\n', '\n'),
+        'ol': ('\n', '\n'),
+        'li': ('  • ', '\n'),
+        'table': ('\n┌─ TABLE ──────────────────────────┐\n', _BOX_BOTTOM),
+        'tr': ('│ ', ' │\n'),
+        'th': ('[', '] '),
+        'td': ('', ' | '),
+        'blockquote': ('\n┌─ QUOTE ──────────────────────────┐\n', '\n' + _BOX_BOTTOM),
+        'p': ('', '\n'),
+    }
+    # Inline emphasis and code boundaries for _format_preview_text (outside code blocks)
+    EMPHASIS = {'strong': '\ue000', 'b': '\ue000', 'em': '\ue001', 'i': '\ue001', 'code': '\ue002'}
+    VOID_TAGS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                           'link', 'meta', 'source', 'track', 'wbr'))
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._out: List[str] = []
+        self._stack: List[str] = []
+        self._hrefs: List[Optional[str]] = []
+        self._skip_depth = 0
+        self._pre_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID_TAGS:
+            if tag == 'hr' and not self._skip_depth:
+                self._out.append('\n' + '-' * 50 + '\n')
+            return
+        self._stack.append(tag)
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+            return
+        if self._skip_depth:
+            return
+        if tag in self.MARKUP:
+            self._out.append(self.MARKUP[tag][0])
+        if tag == 'pre':
+            self._pre_depth += 1
+        elif tag in self.EMPHASIS:
+            if not self._pre_depth:
+                self._out.append(self.EMPHASIS[tag])
+        elif tag == 'a':
+            self._hrefs.append(dict(attrs).get('href'))
+        elif tag == 'span' and ('class', 'citation') in attrs:
+            self._out.append('📄 ')
+    
+    def handle_endtag(self, tag):
+        if tag not in self._stack:
+            return
+        # Close any unclosed children along with the element itself
+        while self._stack:
+            open_tag = self._stack.pop()
+            self._close(open_tag)
+            if open_tag == tag:
+                break
+    
+    def _close(self, tag):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth -= 1
+            return
+        if self._skip_depth:
+            return
+        if tag == 'pre':
+            self._pre_depth -= 1
+        elif tag in self.EMPHASIS:
+            if not self._pre_depth:
+                self._out.append(self.EMPHASIS[tag])
+        elif tag == 'a':
+            href = self._hrefs.pop() if self._hrefs else None
+            if href:
+                self._out.append(f' ({href})')
+        if tag in self.MARKUP:
+            self._out.append(self.MARKUP[tag][1])
+    
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        if self._stack and self._stack[-1] in self.STRUCTURAL_TAGS and data.isspace():
+            return
+        if _PREVIEW_MARKER_RE.search(data):
+            data = _PREVIEW_MARKER_RE.sub('', data)
+        self._out.append(data)
+    
+    def close_and_get(self) -> str:
+        """Finish parsing and return the cleaned-up preview text"""
+        self.close()
+        text = ''.join(self._out)
+        
+        # Clean up whitespace - but preserve intentional spacing
+        # Remove excessive blank lines (more than 2 consecutive)
+        text = _BLANK_LINES_RE.sub('\n\n', text)
+        # Remove trailing whitespace from lines
+        text = _TRAILING_WS_RE.sub('', text)
+        return text.strip()
+
+
 # ============================================================================
 # GUI Application
 # ============================================================================
 
+# Dropped paths containing spaces arrive wrapped in braces: {C:/My Files/a.md} b.md
+_DND_BRACED_RE = re.compile(r'\{([^}]+)\}')
+
+# Command that opens a file with its default application (looked up once at import)
+_OPEN_CMD = None
+if hasattr(os, 'startfile'):
+    _OPEN_CMD = ('startfile',)
+elif shutil.which('xdg-open'):
+    _OPEN_CMD = ('xdg-open',)
+elif shutil.which('open'):
+    _OPEN_CMD = ('open',)
+
+
+def _os_open(path):
+    """Open a file with its default application without blocking the GUI"""
+    if _OPEN_CMD is None:
+        return
+    if _OPEN_CMD[0] == 'startfile':
+        os.startfile(path)
+    else:
+        subprocess.Popen([_OPEN_CMD[0], path])
+
+# Longer documents are cut (at a line break) before rendering the live preview
+_PREVIEW_MAX_CHARS = 20_000
+# Quiet period after the last edit before the preview is re-rendered, scaled with
+# the document length (ms per editor line) between a floor and a ceiling
+_PREVIEW_DEBOUNCE_MIN_MS = 100
+_PREVIEW_DEBOUNCE_MAX_MS = 600
+_PREVIEW_DEBOUNCE_MS_PER_LINE = 0.25
+# Rendered preview HTML kept per (markdown, CSS preset) so preset flips and undo/redo skip conversion
+_PREVIEW_HTML_CACHE_SIZE = 8
+
+# Editor content shown at startup
+_SAMPLE_MD = """# Markdown to PDF/DOCX Converter
+
+Willkommen beim **Markdown-Converter** mit moderner Formatierung!
+
+## Features
+
+- **PDF Export** mit ReportLab oder Browser-Engine
+- **DOCX Export** für Word-Kompatibilität
+- **Live Preview** im Browser
+- **Drag & Drop** Unterstützung
+
+## Beispiel-Text
+
+Dies ist ein Beispiel für **fettgedruckten** und *kursiven* Text.
+
+### Code-Beispiel
+
+```python
+def hello_world():
+    print("Hello, World!")
+```
+
+## Tabelle
+
+| Feature | Status |
+|---------|--------|
+| PDF Export | ✓ |
+| DOCX Export | ✓ |
+| Preview | ✓ |
+"""
+
+
 class MarkdownConverterGUI:
     """GUI application for markdown conversion"""
     
@@ -2365,14 +3037,32 @@ class MarkdownConverterGUI:
         
         self.current_html = ""
         self.browser_preview_path: Optional[str] = None
+        self._last_browser_html_hash: Optional[bytes] = None  # Digest of the HTML in browser_preview_path
         self.current_file_path: Optional[str] = None  # Track current file for save dialog
+        self._cached_abs_path: Optional[Tuple[str, Path]] = None  # (current_file_path, its absolute Path)
         self.preview_html = None  # HTML browser widget
         self.preview_text = None  # Text preview widget (fallback)
         self.use_html_preview = False  # Whether to use HTML browser or text preview
+        self._render_preview = self._render_preview_text  # Shows current_html in whichever preview widget exists
+        self._last_rendered_md: Optional[str] = None  # Editor content shown in the preview
+        self._block_cache: Dict[bytes, str] = {}  # Rendered HTML per markdown block (incremental preview)
+        self._last_preview_text = ""  # Text currently shown in the text preview widget
+        self._preview_dirty = False  # Preview update skipped while the preview was not visible
+        self._preview_job: Optional[str] = None  # Pending after() id of the debounced preview update
+        self._last_edit_time = 0.0  # time.monotonic() of the last editor change
+        self._preview_delay_ms = _PREVIEW_DEBOUNCE_MIN_MS  # Debounce for the current document length
+        self._preview_gen = 0  # Incremented per preview request; stale conversion results are dropped
+        self._render_lock = threading.Lock()  # Serializes preview conversions (shared block cache)
+        self._render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preview")  # Preview conversions
+        self._last_md_key: Optional[tuple] = None  # (markdown digest, CSS preset) of current_html
+        self._preview_html_cache: Dict[tuple, str] = {}  # Recent preview HTML by (markdown digest, CSS preset), LRU order
+        self._last_loaded_html_hash: Optional[bytes] = None  # Digest of the HTML shown in the browser widget
         
         self.setup_ui()
         if HAS_DND:
             self.setup_drag_drop()
+        self.root.bind('<Map>', self._on_root_map)
+        self.root.bind('<FocusIn>', self._on_root_focus_in)
         
         # Save settings on exit
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -2442,8 +3132,10 @@ class MarkdownConverterGUI:
         tk.Label(pdf_settings, text="PDF Engine:", bg=UIColors.BG_PRIMARY, font=UIFonts.SMALL).pack(side='left', padx=UISpacing.SM)
         self.pdf_engine = tk.StringVar(value="browser")  # Browser engine as default
         tk.Radiobutton(pdf_settings, text="Browser", variable=self.pdf_engine, value="browser", bg=UIColors.BG_PRIMARY).pack(side='left', padx=UISpacing.XS)
-        if _try_import_weasyprint():
-            tk.Radiobutton(pdf_settings, text="WeasyPrint", variable=self.pdf_engine, value="weasyprint", bg=UIColors.BG_PRIMARY).pack(side='left', padx=UISpacing.XS)
+        # Only check that WeasyPrint is installed here - it (and GTK) is imported when the engine is selected
+        if importlib.util.find_spec('weasyprint') is not None:
+            tk.Radiobutton(pdf_settings, text="WeasyPrint", variable=self.pdf_engine, value="weasyprint", bg=UIColors.BG_PRIMARY,
+                           command=self._on_weasyprint_selected).pack(side='left', padx=UISpacing.XS)
         tk.Radiobutton(pdf_settings, text="ReportLab", variable=self.pdf_engine, value="reportlab", bg=UIColors.BG_PRIMARY).pack(side='left', padx=UISpacing.XS)
         
         tk.Label(pdf_settings, text="Layout:", bg=UIColors.BG_PRIMARY, font=UIFonts.SMALL).pack(side='left', padx=(UISpacing.LG, UISpacing.SM))
@@ -2495,36 +3187,29 @@ class MarkdownConverterGUI:
             insertbackground=UIColors.PRIMARY
         )
         self.text_input.pack(fill='both', expand=True, padx=UISpacing.SM, pady=UISpacing.SM)
-        self.text_input.bind('<KeyRelease>', self.on_text_change)
+        self.text_input.bind('<<Modified>>', self.on_text_change)
         
         # Right: Preview
         right_frame = tk.LabelFrame(content_frame, text=" HTML Preview ", font=UIFonts.HEADING, bg=UIColors.BG_PRIMARY, fg=UIColors.TEXT_PRIMARY)
         right_frame.pack(side='right', fill='both', expand=True, padx=(UISpacing.SM, 0))
         
+        self.preview_frame = right_frame
+        
         # Use embedded HTML browser if available, otherwise fall back to text preview
         if TKINTERWEB_AVAILABLE:
             try:
-                # Create embedded HTML browser widget
+                from tkinterweb import HtmlFrame
                 self.preview_html = HtmlFrame(right_frame, messages_enabled=False)
-                self.preview_html.pack(fill='both', expand=True, padx=UISpacing.SM, pady=UISpacing.SM)
-                self.preview_text = None  # Not used when HTML browser is available
-                self.use_html_preview = True
             except Exception as e:
                 print(f"[WARNING] Failed to create HTML browser widget: {e}")
-                # Fall back to text preview
-                self.preview_text = scrolledtext.ScrolledText(
-                    right_frame,
-                    wrap=tk.WORD,
-                    font=UIFonts.BODY,
-                    bg=UIColors.BG_PRIMARY,
-                    fg=UIColors.TEXT_PRIMARY,
-                    state='disabled'
-                )
-                self.preview_text.pack(fill='both', expand=True, padx=UISpacing.SM, pady=UISpacing.SM)
                 self.preview_html = None
-                self.use_html_preview = False
+        
+        if self.preview_html:
+            self.preview_html.pack(fill='both', expand=True, padx=UISpacing.SM, pady=UISpacing.SM)
+            self.preview_text = None  # Not used when HTML browser is available
+            self.use_html_preview = True
+            self._render_preview = self._render_preview_html
         else:
-            # Fall back to text preview
             self.preview_text = scrolledtext.ScrolledText(
                 right_frame,
                 wrap=tk.WORD,
@@ -2534,8 +3219,9 @@ class MarkdownConverterGUI:
                 state='disabled'
             )
             self.preview_text.pack(fill='both', expand=True, padx=UISpacing.SM, pady=UISpacing.SM)
-            self.preview_html = None
+            self._configure_preview_tags()
             self.use_html_preview = False
+            self._render_preview = self._render_preview_text
         
         # Status bar
         self.status_var = tk.StringVar(value="Ready - Drag .md files here or paste markdown content")
@@ -2553,6 +3239,17 @@ class MarkdownConverterGUI:
         
         self.load_sample_content()
     
+    def _configure_preview_tags(self):
+        """Configure the text preview formatting tags (once, at widget creation)"""
+        self.preview_text.tag_configure("heading1", font=("Segoe UI", 16, "bold"), foreground=UIColors.PRIMARY)
+        self.preview_text.tag_configure("heading2", font=("Segoe UI", 13, "bold"), foreground=UIColors.PRIMARY)
+        self.preview_text.tag_configure("heading3", font=("Segoe UI", 11, "bold"), foreground=UIColors.TEXT_PRIMARY)
+        self.preview_text.tag_configure("heading4", font=("Segoe UI", 10, "bold"), foreground=UIColors.TEXT_SECONDARY)
+        self.preview_text.tag_configure("separator", foreground=UIColors.BORDER)
+        self.preview_text.tag_configure("code", font=("Consolas", 9), background=UIColors.BG_TERTIARY, foreground="#e74c3c")
+        self.preview_text.tag_configure("bold", font=("Segoe UI", 10, "bold"))
+        self.preview_text.tag_configure("italic", font=("Segoe UI", 10, "italic"))
+    
     def create_rounded_button(self, parent, text, command, style="primary"):
         """Create a styled button"""
         colors_map = {
@@ -2611,9 +3308,8 @@ class MarkdownConverterGUI:
         """Parse dropped file paths"""
         files = []
         if '{' in data:
-            import re
-            files = re.findall(r'\{([^}]+)\}', data)
-            remaining = re.sub(r'\{[^}]+\}', '', data).strip()
+            files = _DND_BRACED_RE.findall(data)
+            remaining = _DND_BRACED_RE.sub('', data).strip()
             if remaining:
                 files.extend(remaining.split())
         else:
@@ -2622,337 +3318,346 @@ class MarkdownConverterGUI:
     
     def load_sample_content(self):
         """Load sample markdown content"""
-        sample = """# Markdown to PDF/DOCX Converter
-
-Willkommen beim **Markdown-Converter** mit moderner Formatierung!
-
-## Features
-
-- **PDF Export** mit ReportLab oder Browser-Engine
-- **DOCX Export** für Word-Kompatibilität
-- **Live Preview** im Browser
-- **Drag & Drop** Unterstützung
-
-## Beispiel-Text
-
-Dies ist ein Beispiel für **fettgedruckten** und *kursiven* Text.
-
-### Code-Beispiel
-
-```python
-def hello_world():
-    print("Hello, World!")
-```
-
-## Tabelle
-
-| Feature | Status |
-|---------|--------|
-| PDF Export | ✓ |
-| DOCX Export | ✓ |
-| Preview | ✓ |
-"""
-        self.text_input.insert("1.0", sample)
+        self._set_editor_content(_SAMPLE_MD)
+    
+    def _set_editor_content(self, content: str):
+        """Replace the editor content programmatically and render the preview once"""
+        self.text_input.delete("1.0", tk.END)
+        self.text_input.insert("1.0", content)
+        # <<Modified>> is queued, not delivered during insert() - clearing the flag here makes
+        # on_text_change ignore it instead of scheduling a second render of the same content
+        self.text_input.edit_modified(False)
         self.update_preview()
     
     def on_css_preset_change(self):
         """Handle CSS preset change"""
         self.css_preset = self.css_preset_var.get()
-        # Update converter's preset if it exists
+        # Update converter's preset if it exists (only affects the CSS in the HTML wrapper,
+        # the converter and its markdown instance are kept)
         if self.converter:
+            old_preset = self.converter.css_preset
             self.converter.css_preset = self.css_preset
+            # Only the style block differs - restyle the shown HTML instead of converting the markdown again
+            if self.current_html and self._last_md_key and self._last_md_key[1] == old_preset:
+                new_key = (self._last_md_key[0], self.css_preset)
+                if new_key not in self._preview_html_cache:
+                    self._preview_html_cache[new_key] = self.converter._restyle_html(self.current_html, old_preset)
         # Update preview with new style
         self.update_preview()
     
     def on_text_change(self, event=None):
         """Handle text changes with delayed preview update"""
-        if hasattr(self, '_update_timer'):
-            self.root.after_cancel(self._update_timer)
-        self._update_timer = self.root.after(500, self.update_preview)
+        # <<Modified>> fires whenever the modified flag flips; reset it so the next edit fires again
+        if not self.text_input.edit_modified():
+            return
+        self.text_input.edit_modified(False)
+        
+        # Skip scheduling when the content matches what the preview already shows
+        if self.text_input.get("1.0", tk.END) == self._last_rendered_md:
+            return
+        
+        self._schedule_preview()
+    
+    def _schedule_preview(self):
+        """Update the preview once the editor has been idle for a length-dependent delay"""
+        self._last_edit_time = time.monotonic()
+        # One pending job covers a whole burst of edits (no cancel/re-schedule per keystroke)
+        if self._preview_job is None:
+            # Short documents render almost at once, long ones wait for a longer pause
+            line_count = int(self.text_input.index('end-1c').split('.')[0])
+            self._preview_delay_ms = min(_PREVIEW_DEBOUNCE_MAX_MS,
+                                         max(_PREVIEW_DEBOUNCE_MIN_MS, int(line_count * _PREVIEW_DEBOUNCE_MS_PER_LINE)))
+            self._preview_job = self.root.after(self._preview_delay_ms, self._run_preview)
+    
+    def _run_preview(self):
+        """Run the debounced preview update, or wait longer if the editor changed meanwhile"""
+        idle_ms = (time.monotonic() - self._last_edit_time) * 1000
+        if idle_ms < self._preview_delay_ms:
+            self._preview_job = self.root.after(int(self._preview_delay_ms - idle_ms) + 1, self._run_preview)
+            return
+        self._preview_job = None
+        self.update_preview()
     
     def update_preview(self):
-        """Update the HTML preview"""
+        """Update the HTML preview (markdown is converted by the preview worker)"""
         if not self.converter:
             self.status_var.set("Error: markdown library not installed")
             return
         
+        # Nobody sees the preview while minimized or unmapped - render once it is shown again
+        if self.root.state() in ('iconic', 'withdrawn') or not self.preview_frame.winfo_viewable():
+            self._preview_dirty = True
+            return
+        self._preview_dirty = False
+        
         try:
-            md_content = self.text_input.get("1.0", tk.END).strip()
+            editor_content = self.text_input.get("1.0", tk.END)
+            md_content = editor_content.strip()
+            # Results of conversions still running for older content are dropped
+            gen = self._preview_gen = self._preview_gen + 1
             if md_content:
-                # Generate HTML from markdown
-                try:
-                    self.current_html = self.converter.markdown_to_html(md_content)
-                except Exception as html_error:
-                    print(f"[ERROR] HTML generation failed: {html_error}")
-                    error_msg = f"Preview error: {str(html_error)}"
-                    if self.use_html_preview and self.preview_html:
-                        self.preview_html.load_html(f"<html><body><h1>Error</h1><p>{error_msg}</p></body></html>")
-                    elif self.preview_text:
-                        preview_content = md_content[:5000]  # Limit length
-                        self.preview_text.config(state="normal")
-                        self.preview_text.delete("1.0", tk.END)
-                        self.preview_text.insert("1.0", preview_content)
-                        self.preview_text.config(state="disabled")
-                    self.status_var.set(error_msg)
+                # Keep preview work bounded for long documents - exports render the full text
+                md_for_preview = md_content
+                if len(md_content) > _PREVIEW_MAX_CHARS:
+                    cut = md_content.rfind('\n', 0, _PREVIEW_MAX_CHARS)
+                    md_for_preview = md_content[:cut if cut > 0 else _PREVIEW_MAX_CHARS]
+                    md_for_preview += "\n\n*[... preview truncated - exports contain the full document ...]*"
+                
+                # Unchanged markdown and style (refocus, repeated triggers) - reuse the last HTML
+                md_key = (hashlib.blake2b(md_for_preview.encode('utf-8'), digest_size=16).digest(),
+                          self.converter.css_preset)
+                if md_key == self._last_md_key:
+                    self._apply_html(gen, editor_content, self.current_html, None, md_key)
+                    return
+                # Recently shown (preset switched back, undo) - reuse without converting
+                cached_html = self._preview_html_cache.get(md_key)
+                if cached_html is not None:
+                    self._apply_html(gen, editor_content, cached_html, None, md_key)
                     return
                 
-                # Update preview based on available widget
-                if self.use_html_preview and self.preview_html:
-                    # Use embedded HTML browser
-                    try:
-                        self.preview_html.load_html(self.current_html)
-                        self.status_var.set("Preview updated (HTML)")
-                    except Exception as html_error:
-                        print(f"[ERROR] Failed to load HTML in browser: {html_error}")
-                        # Fallback to text preview if available
-                        if self.preview_text:
-                            preview_content = self._html_to_text_preview(self.current_html)
-                            self.preview_text.config(state="normal")
-                            self.preview_text.delete("1.0", tk.END)
-                            self.preview_text.insert("1.0", preview_content)
-                            self.preview_text.config(state="disabled")
-                        self.status_var.set(f"Preview error: {str(html_error)}")
-                else:
-                    # Use text preview
-                    try:
-                        preview_content = self._html_to_text_preview(self.current_html)
-                    except Exception as preview_error:
-                        print(f"[ERROR] Preview conversion failed: {preview_error}")
-                        # Fallback: show raw HTML (limited)
-                        preview_content = self.current_html[:2000] + "\n\n[... HTML truncated ...]"
-                    
-                    # Ensure we have content to display
-                    if not preview_content or preview_content.strip() == "":
-                        # Last resort: show markdown directly
-                        preview_content = md_content[:5000]
-                        if len(md_content) > 5000:
-                            preview_content += "\n\n[... content truncated ...]"
-                    
-                    if self.preview_text:
-                        self.preview_text.config(state="normal")
-                        self.preview_text.delete("1.0", tk.END)
-                        self.preview_text.insert("1.0", preview_content)
-                        
-                        # Apply formatting (this should not modify text, only add tags)
-                        try:
-                            self._apply_preview_formatting()
-                        except Exception as format_error:
-                            # If formatting fails, at least show the text
-                            print(f"[WARNING] Preview formatting error: {format_error}")
-                        
-                        self.preview_text.config(state="disabled")
-                    
-                    self.status_var.set("Preview updated")
+                self._render_executor.submit(self._bg_convert, gen, editor_content, md_for_preview, md_key)
             else:
                 self.current_html = ""
+                self._last_md_key = None
                 if self.use_html_preview and self.preview_html:
-                    self.preview_html.load_html("<html><body><p>No content to preview</p></body></html>")
+                    self._load_preview_html("<html><body><p>No content to preview</p></body></html>")
                 elif self.preview_text:
-                    self.preview_text.config(state="normal")
-                    self.preview_text.delete("1.0", tk.END)
-                    self.preview_text.config(state="disabled")
+                    self._set_preview_text("")
                 self.status_var.set("No content to preview")
+                self._last_rendered_md = editor_content
         except Exception as e:
-            error_msg = f"Preview error: {str(e)}"
-            self.status_var.set(error_msg)
-            print(f"[ERROR] {error_msg}")
-            import traceback
-            traceback.print_exc()
-            
-            # Show error in preview
-            if self.use_html_preview and self.preview_html:
-                self.preview_html.load_html(f"<html><body><h1>Error</h1><p>Error generating preview:</p><p>{str(e)}</p><p>Please check console for details.</p></body></html>")
-            elif self.preview_text:
-                self.preview_text.config(state="normal")
-                self.preview_text.delete("1.0", tk.END)
-                self.preview_text.insert("1.0", f"Error generating preview:\n{str(e)}\n\nPlease check console for details.")
-                self.preview_text.config(state="disabled")
+            self._show_preview_error(e)
+    
+    def _bg_convert(self, gen: int, editor_content: str, md_for_preview: str, md_key: tuple):
+        """Convert markdown to HTML in the preview worker (must not touch Tk widgets)"""
+        if gen != self._preview_gen:
+            return  # Superseded while queued behind an earlier conversion
+        
+        # Generate HTML from markdown
+        html_content, html_error = None, None
+        try:
+            html_content = self._render_incremental(md_for_preview)
+        except Exception as e:
+            html_error = e
+        
+        try:
+            self.root.after(0, self._apply_html, gen, editor_content, html_content, html_error, md_key)
+        except RuntimeError:
+            pass  # Main loop already gone (window closed)
+    
+    def _apply_html(self, gen: int, editor_content: str, html_content: Optional[str],
+                    html_error: Optional[Exception], md_key: tuple):
+        """Show a converted document in the preview (runs in the Tk main thread)"""
+        if gen != self._preview_gen:
+            return  # The editor changed while converting - a newer result is on its way
+        
+        try:
+            md_content = editor_content.strip()
+            if html_error is not None:
+                print(f"[ERROR] HTML generation failed: {html_error}")
+                error_msg = f"Preview error: {str(html_error)}"
+                if self.use_html_preview and self.preview_html:
+                    self._load_preview_html(f"<html><body><h1>Error</h1><p>{error_msg}</p></body></html>")
+                elif self.preview_text:
+                    preview_content = md_content[:5000]  # Limit length
+                    self._set_preview_text(preview_content)
+                self.status_var.set(error_msg)
+                return
+            
+            self.current_html = html_content
+            self._last_md_key = md_key
+            cache = self._preview_html_cache
+            cache.pop(md_key, None)
+            cache[md_key] = html_content
+            if len(cache) > _PREVIEW_HTML_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            self._render_preview(md_content)
+            self._last_rendered_md = editor_content
+        except Exception as e:
+            self._show_preview_error(e)
+    
+    def _render_preview_html(self, md_content: str):
+        """Show current_html in the embedded HTML browser"""
+        try:
+            self._load_preview_html(self.current_html)
+            self.status_var.set("Preview updated (HTML)")
+        except Exception as html_error:
+            print(f"[ERROR] Failed to load HTML in browser: {html_error}")
+            self.status_var.set(f"Preview error: {str(html_error)}")
+    
+    def _render_preview_text(self, md_content: str):
+        """Show current_html as formatted plain text in the text preview"""
+        try:
+            preview_content = self._html_to_text_preview(self.current_html)
+        except Exception as preview_error:
+            print(f"[ERROR] Preview conversion failed: {preview_error}")
+            # Fallback: show raw HTML (limited)
+            preview_content = f"{self.current_html[:2000]}\n\n[... HTML truncated ...]"
+        
+        # Ensure we have content to display
+        if not preview_content or preview_content.isspace():
+            # Last resort: show markdown directly
+            if len(md_content) > 5000:
+                preview_content = f"{md_content[:5000]}\n\n[... content truncated ...]"
+            else:
+                preview_content = md_content
+        
+        self._set_preview_text(preview_content, apply_formatting=True)
+        self.status_var.set("Preview updated")
+    
+    def _show_preview_error(self, e: Exception):
+        """Report an unexpected preview failure in the status bar and the preview"""
+        error_msg = f"Preview error: {str(e)}"
+        self.status_var.set(error_msg)
+        print(f"[ERROR] {error_msg}")
+        import traceback
+        traceback.print_exc()
+        
+        # Show error in preview
+        if self.use_html_preview and self.preview_html:
+            self._load_preview_html(f"<html><body><h1>Error</h1><p>Error generating preview:</p><p>{str(e)}</p><p>Please check console for details.</p></body></html>")
+        elif self.preview_text:
+            self._set_preview_text(f"Error generating preview:\n{str(e)}\n\nPlease check console for details.")
+    
+    def _get_full_html(self) -> str:
+        """HTML of the whole document for export (the live preview HTML may be truncated or rendered per block)"""
+        return self.converter.markdown_to_html(self.text_input.get("1.0", tk.END).strip())
+    
+    def _on_root_map(self, event):
+        """Catch up on a preview update skipped while the window or preview pane was unmapped"""
+        # <Map> on the root is also delivered for every child widget being mapped
+        if self._preview_dirty and (event.widget is self.root or event.widget is self.preview_frame):
+            self.update_preview()
+    
+    def _on_root_focus_in(self, event):
+        """Catch up on a skipped preview update when the window gets focus back"""
+        if self._preview_dirty:
+            self.update_preview()
+    
+    def _on_weasyprint_selected(self):
+        """Load WeasyPrint when its engine is chosen, switching back to the browser engine if it fails"""
+        self.status_var.set("Loading WeasyPrint...")
+        self.root.config(cursor="wait")
+        self.root.update()
+        try:
+            available = _try_import_weasyprint()
+        finally:
+            self.root.config(cursor="")
+        
+        if available:
+            self.status_var.set("PDF engine: WeasyPrint")
+            return
+        self.pdf_engine.set("browser")
+        self.status_var.set("WeasyPrint not available - using the browser engine")
+        messagebox.showwarning(
+            "WeasyPrint not available",
+            "WeasyPrint is installed but could not be loaded (on Windows it needs the GTK runtime).\n"
+            "PDF export will use the browser engine instead."
+        )
+    
+    def _load_preview_html(self, html_content: str):
+        """Load HTML into the embedded browser unless it already shows exactly this document"""
+        digest = hashlib.blake2b(html_content.encode('utf-8'), digest_size=16).digest()
+        if digest != self._last_loaded_html_hash:
+            self.preview_html.load_html(html_content)
+            self._last_loaded_html_hash = digest
+    
+    def _set_preview_text(self, content: str, apply_formatting: bool = False):
+        """Show content in the read-only text preview, unlocking the widget once for all changes"""
+        self.preview_text.config(state="normal")
+        try:
+            if apply_formatting:
+                self._apply_preview_formatting(content)
+            else:
+                self._replace_preview_text(content)
+        finally:
+            self.preview_text.config(state="disabled")
+    
+    def _replace_preview_text(self, new_text: str):
+        """Replace the text preview content, deleting/inserting only the region that changed"""
+        old_text = self._last_preview_text
+        self._last_preview_text = new_text
+        
+        # Common prefix/suffix of the shown and the new text (the suffix may not overlap the prefix)
+        prefix_len = len(os.path.commonprefix([old_text, new_text]))
+        suffix_len = min(len(os.path.commonprefix([old_text[::-1], new_text[::-1]])),
+                         min(len(old_text), len(new_text)) - prefix_len)
+        changed = max(len(old_text), len(new_text)) - prefix_len - suffix_len
+        
+        # Offsets are Python code points; with an emoji before the changed region they
+        # would not match Tk's char indices, so replace everything instead
+        if (not old_text or not new_text or changed > 0.8 * len(new_text)
+                or _NON_BMP_RE.search(old_text, 0, len(old_text) - suffix_len)):
+            self.preview_text.delete("1.0", tk.END)
+            self.preview_text.insert("1.0", new_text)
+            return
+        
+        if changed:
+            start = self.preview_text.index(f"1.0 + {prefix_len} chars")
+            end = self.preview_text.index(f"1.0 + {len(old_text) - suffix_len} chars")
+            self.preview_text.delete(start, end)
+            self.preview_text.insert(start, new_text[prefix_len:len(new_text) - suffix_len])
+    
+    def _render_incremental(self, md_content: str) -> str:
+        """Render markdown to HTML, converting only the blocks that changed since the last render"""
+        with self._render_lock:
+            converter = self.converter
+            md_content = converter.preprocess_markdown(md_content)
+            document_title = converter.extract_title_from_markdown(md_content)
+            
+            # Reference-style link definitions, [TOC] and multi-line raw HTML span blocks - render the document as a whole
+            if ('[TOC]' in md_content or _MD_REFERENCE_DEF_RE.search(md_content)
+                    or _has_open_html_block(md_content)):
+                self._block_cache = {}
+                return converter._wrap_shell(converter._render_body(md_content), document_title)
+            
+            # Keep only the blocks of the current document so the cache stays bounded
+            block_cache = {}
+            fragments = []
+            for block in _split_markdown_blocks(md_content):
+                key = hashlib.blake2b(block.encode('utf-8'), digest_size=16).digest()
+                html_fragment = self._block_cache.get(key)
+                if html_fragment is None:
+                    html_fragment = converter._render_body(block)
+                block_cache[key] = html_fragment
+                fragments.append(html_fragment)
+            self._block_cache = block_cache
+            
+            html_body = '\n'.join(fragments)
+            # Repeated headings get unique ids (intro, intro_1) only when rendered together
+            heading_ids = _HEADING_ID_RE.findall(html_body)
+            if len(heading_ids) != len(set(heading_ids)):
+                html_body = converter._render_body(md_content)
+            return converter._wrap_shell(html_body, document_title)
     
     def _html_to_text_preview(self, html_content: str) -> str:
         """Convert HTML to readable text preview with formatting"""
-        # Remove style and script tags completely
-        html_content = re.sub(r'<style[^>]*>.*?</style>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-        html_content = re.sub(r'<script[^>]*>.*?</script>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Remove head and meta tags
-        html_content = re.sub(r'<head[^>]*>.*?</head>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-        html_content = re.sub(r'<meta[^>]*>', '', html_content, flags=re.IGNORECASE)
-        html_content = re.sub(r'<!DOCTYPE[^>]*>', '', html_content, flags=re.IGNORECASE)
-        
-        # Convert horizontal rules first (before headings)
-        html_content = re.sub(r'<hr[^>]*>', '\n' + '-' * 50 + '\n', html_content, flags=re.IGNORECASE)
-        
-        # Convert headings with cleaner formatting
-        html_content = re.sub(r'<h1[^>]*>(.*?)</h1>', r'\n\n\1\n' + '=' * 50 + '\n', html_content, flags=re.DOTALL | re.IGNORECASE)
-        html_content = re.sub(r'<h2[^>]*>(.*?)</h2>', r'\n\n\1\n' + '-' * 50 + '\n', html_content, flags=re.DOTALL | re.IGNORECASE)
-        html_content = re.sub(r'<h3[^>]*>(.*?)</h3>', r'\n\n\1\n' + '·' * 50 + '\n', html_content, flags=re.DOTALL | re.IGNORECASE)
-        html_content = re.sub(r'<h4[^>]*>(.*?)</h4>', r'\n\1\n', html_content, flags=re.DOTALL | re.IGNORECASE)
-        html_content = re.sub(r'<h[5-6][^>]*>(.*?)</h[5-6]>', r'\n\1\n', html_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Convert code blocks
-        html_content = re.sub(r'<pre[^>]*><code[^>]*>(.*?)</code></pre>', r'\n┌─ CODE BLOCK ─────────────────────┐\n\1\n└──────────────────────────────────┘\n', html_content, flags=re.DOTALL | re.IGNORECASE)
-        html_content = re.sub(r'<pre[^>]*>(.*?)</pre>', r'\n┌─ CODE BLOCK ─────────────────────┐\n\1\n└──────────────────────────────────┘\n', html_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Convert inline code
-        html_content = re.sub(r'<code[^>]*>(.*?)</code>', r'`\1`', html_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Convert lists - preserve nested structure
-        html_content = re.sub(r'<ul[^>]*>', '\n', html_content, flags=re.IGNORECASE)
-        html_content = re.sub(r'</ul>', '\n', html_content, flags=re.IGNORECASE)
-        html_content = re.sub(r'<ol[^>]*>', '\n', html_content, flags=re.IGNORECASE)
-        html_content = re.sub(r'</ol>', '\n', html_content, flags=re.IGNORECASE)
-        # Handle list items - check for nested lists
-        def replace_li(match):
-            content = match.group(1)
-            # Check if it contains nested lists
-            if '<ul' in content or '<ol' in content:
-                return f'  • {content}\n'
-            return f'  • {content}\n'
-        html_content = re.sub(r'<li[^>]*>(.*?)</li>', replace_li, html_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Convert tables
-        html_content = re.sub(r'<table[^>]*>', '\n┌─ TABLE ──────────────────────────┐\n', html_content, flags=re.IGNORECASE)
-        html_content = re.sub(r'</table>', '└──────────────────────────────────┘\n', html_content, flags=re.IGNORECASE)
-        html_content = re.sub(r'<tr[^>]*>', '│ ', html_content, flags=re.IGNORECASE)
-        html_content = re.sub(r'</tr>', ' │\n', html_content, flags=re.IGNORECASE)
-        html_content = re.sub(r'<th[^>]*>(.*?)</th>', r'[\1] ', html_content, flags=re.DOTALL | re.IGNORECASE)
-        html_content = re.sub(r'<td[^>]*>(.*?)</td>', r'\1 | ', html_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Convert blockquotes
-        html_content = re.sub(r'<blockquote[^>]*>(.*?)</blockquote>', r'\n┌─ QUOTE ──────────────────────────┐\n\1\n└──────────────────────────────────┘\n', html_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Convert paragraphs - but preserve spacing
-        html_content = re.sub(r'<p[^>]*>(.*?)</p>', r'\1\n', html_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Convert div containers (remove but preserve content)
-        html_content = re.sub(r'<div[^>]*class="container"[^>]*>', '', html_content, flags=re.IGNORECASE)
-        html_content = re.sub(r'<div[^>]*class="table-container"[^>]*>', '', html_content, flags=re.IGNORECASE)
-        html_content = re.sub(r'<div[^>]*class="list-container"[^>]*>', '', html_content, flags=re.IGNORECASE)
-        html_content = re.sub(r'</div>', '', html_content, flags=re.IGNORECASE)
-        
-        # Convert bold and italic - just extract text (formatting will be applied separately)
-        html_content = re.sub(r'<strong[^>]*>(.*?)</strong>', r'\1', html_content, flags=re.DOTALL | re.IGNORECASE)
-        html_content = re.sub(r'<b[^>]*>(.*?)</b>', r'\1', html_content, flags=re.DOTALL | re.IGNORECASE)
-        html_content = re.sub(r'<em[^>]*>(.*?)</em>', r'\1', html_content, flags=re.DOTALL | re.IGNORECASE)
-        html_content = re.sub(r'<i[^>]*>(.*?)</i>', r'\1', html_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Convert links
-        html_content = re.sub(r'<a[^>]*href="([^"]*)"[^>]*>(.*?)</a>', r'\2 (\1)', html_content, flags=re.DOTALL | re.IGNORECASE)
-        html_content = re.sub(r'<a[^>]*>(.*?)</a>', r'\1', html_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Convert citations
-        html_content = re.sub(r'<span class="citation"[^>]*>(.*?)</span>', r'📄 \1', html_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Remove remaining HTML tags
-        html_content = re.sub(r'<[^>]+>', '', html_content)
-        
-        # Decode HTML entities
-        html_content = html_content.replace('&amp;', '&')
-        html_content = html_content.replace('&lt;', '<')
-        html_content = html_content.replace('&gt;', '>')
-        html_content = html_content.replace('&quot;', '"')
-        html_content = html_content.replace('&#39;', "'")
-        html_content = html_content.replace('&nbsp;', ' ')
-        
-        # Clean up whitespace - but preserve intentional spacing
-        # Remove excessive blank lines (more than 2 consecutive)
-        html_content = re.sub(r'\n\s*\n\s*\n+', '\n\n', html_content)
-        # Remove leading/trailing whitespace from lines
-        lines = html_content.split('\n')
-        cleaned_lines = [line.rstrip() for line in lines]
-        html_content = '\n'.join(cleaned_lines)
-        html_content = html_content.strip()
+        emitter = _PreviewEmitter()
+        emitter.feed(html_content)
+        text = emitter.close_and_get()
         
         # Ensure we always return something
-        if not html_content:
+        if not text:
             return "Preview: Content is empty or could not be converted"
         
-        return html_content
+        return text
     
-    def _apply_preview_formatting(self):
-        """Apply text formatting tags to preview (read-only, doesn't modify text)"""
+    def _apply_preview_formatting(self, content: str):
+        """Show content in the text preview with inline markup stripped and headings, separators, code and emphasis tagged"""
+        # Work out the shown text and all tag ranges in Python, then touch the widget once
         try:
-            content = self.preview_text.get("1.0", tk.END)
-            if not content or content.strip() == "":
-                return  # Nothing to format
-            
-            lines = content.split('\n')
-            
-            # Configure tags
-            self.preview_text.tag_configure("heading1", font=("Segoe UI", 16, "bold"), foreground=UIColors.PRIMARY)
-            self.preview_text.tag_configure("heading2", font=("Segoe UI", 13, "bold"), foreground=UIColors.PRIMARY)
-            self.preview_text.tag_configure("heading3", font=("Segoe UI", 11, "bold"), foreground=UIColors.TEXT_PRIMARY)
-            self.preview_text.tag_configure("heading4", font=("Segoe UI", 10, "bold"), foreground=UIColors.TEXT_SECONDARY)
-            self.preview_text.tag_configure("separator", foreground=UIColors.BORDER)
-            self.preview_text.tag_configure("code", font=("Consolas", 9), background=UIColors.BG_TERTIARY, foreground="#e74c3c")
-            self.preview_text.tag_configure("bold", font=("Segoe UI", 10, "bold"))
-            self.preview_text.tag_configure("italic", font=("Segoe UI", 10, "italic"))
-            
-            # Find and tag headings and separators
-            for line_num, line in enumerate(lines, 1):
-                if line_num > len(lines):
-                    break
-                    
-                line_start = f"{line_num}.0"
-                line_end = f"{line_num}.end"
-                
-                # Tag separators (lines with =, -, or ·)
-                if line and all(c in '=-·' for c in line.strip()) and len(line.strip()) > 10:
-                    try:
-                        self.preview_text.tag_add("separator", line_start, line_end)
-                        # Tag the line before as heading
-                        if line_num > 1:
-                            prev_line = f"{line_num-1}.0"
-                            prev_line_end = f"{line_num-1}.end"
-                            if '=' in line:
-                                self.preview_text.tag_add("heading1", prev_line, prev_line_end)
-                            elif '-' in line:
-                                self.preview_text.tag_add("heading2", prev_line, prev_line_end)
-                            elif '·' in line:
-                                self.preview_text.tag_add("heading3", prev_line, prev_line_end)
-                    except Exception:
-                        pass  # Skip if line doesn't exist
-                elif line.strip() and line_num > 1:
-                    # Check if previous line was a separator
-                    prev_line = lines[line_num - 2] if line_num > 1 else ""
-                    if prev_line and all(c in '=-·' for c in prev_line.strip()) and len(prev_line.strip()) > 10:
-                        try:
-                            if '=' in prev_line:
-                                self.preview_text.tag_add("heading1", line_start, line_end)
-                            elif '-' in prev_line:
-                                self.preview_text.tag_add("heading2", line_start, line_end)
-                            elif '·' in prev_line:
-                                self.preview_text.tag_add("heading3", line_start, line_end)
-                        except Exception:
-                            pass
-                
-                # Tag code blocks
-                if '┌─ CODE' in line or '└─' in line or (line.strip().startswith('│') and 'CODE' in line):
-                    try:
-                        self.preview_text.tag_add("code", line_start, line_end)
-                    except Exception:
-                        pass
-                
-                # Tag inline code (backticks) - process from end to start
-                if '`' in line and not line.startswith('┌─'):
-                    try:
-                        line_content = self.preview_text.get(line_start, line_end)
-                        code_matches = list(re.finditer(r'`([^`]+)`', line_content))
-                        for match in reversed(code_matches):
-                            code_text = match.group(1)
-                            start_pos = f"{line_num}.{match.start()}"
-                            end_pos = f"{line_num}.{match.end()}"
-                            # Replace backticks with text
-                            self.preview_text.delete(start_pos, end_pos)
-                            self.preview_text.insert(start_pos, code_text)
-                            # Apply code formatting
-                            new_end = f"{line_num}.{match.start() + len(code_text)}"
-                            self.preview_text.tag_add("code", start_pos, new_end)
-                    except Exception:
-                        pass  # Skip if there's an error
+            shown_text, tag_ranges = _format_preview_text(content)
         except Exception as e:
-            # Don't break preview if formatting fails
+            # If formatting fails, at least show the text
             print(f"[WARNING] Preview formatting error: {e}")
+            self._replace_preview_text(content)
+            return
+        
+        self._replace_preview_text(shown_text)
+        for tag, ranges in tag_ranges.items():
+            self.preview_text.tag_remove(tag, "1.0", tk.END)
+            if ranges:
+                self.preview_text.tag_add(tag, *ranges)
     
     def open_file(self):
         """Open and load a markdown file"""
@@ -2970,9 +3675,7 @@ def hello_world():
             # Use encoding detection instead of hardcoded UTF-8
             content = _read_file_with_encoding_detection(file_path)
             
-            self.text_input.delete("1.0", tk.END)
-            self.text_input.insert("1.0", content)
-            self.update_preview()
+            self._set_editor_content(content)
             
             # Track file path for save dialog
             self.current_file_path = file_path
@@ -2983,148 +3686,131 @@ def hello_world():
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load file: {str(e)}")
     
-    def save_pdf(self):
-        """Save content as PDF"""
-        if not self.converter:
-            messagebox.showerror("Error", "Markdown library not installed. Please install with: pip install markdown")
-            return
-        
-        md_content = self.text_input.get("1.0", tk.END).strip()
-        if not md_content:
-            messagebox.showwarning("Warning", "No content to export!")
-            return
-        
-        # Determine initial directory and filename from current file or use current working directory
-        initial_dir = None
-        initial_file = None
+    def _is_editor_empty(self) -> bool:
+        """Check for an empty editor by index, without copying the buffer"""
+        return self.text_input.compare("end-1c", "==", "1.0")
+    
+    def _get_export_markdown(self) -> str:
+        """Editor markdown for export ("" for an empty editor)"""
+        if self._is_editor_empty():
+            return ""
+        # "end-1c" skips the newline Tk always keeps after the last line
+        return self.text_input.get("1.0", "end-1c").strip()
+    
+    def _derive_save_defaults(self, ext: str) -> Tuple[Optional[str], Optional[str]]:
+        """Initial directory and filename for a save dialog, based on the loaded file"""
         if self.current_file_path:
-            initial_dir = os.path.dirname(os.path.abspath(self.current_file_path))
+            # Absolute path is only recomputed when another file was loaded
+            if self._cached_abs_path is None or self._cached_abs_path[0] != self.current_file_path:
+                self._cached_abs_path = (self.current_file_path, Path(self.current_file_path).absolute())
+            path = self._cached_abs_path[1]
             # Auto-set filename based on loaded file basename
-            base_name = os.path.splitext(os.path.basename(self.current_file_path))[0]
-            initial_file = f"{base_name}.pdf"
-        elif os.path.exists(os.getcwd()):
-            initial_dir = os.getcwd()
-        
-        file_path = filedialog.asksaveasfilename(
-            title="Save as PDF",
-            defaultextension=".pdf",
+            return str(path.parent), f"{path.stem}.{ext}"
+        # No file loaded - fall back to the current working directory
+        if os.path.exists(os.getcwd()):
+            return os.getcwd(), None
+        return None, None
+    
+    def save_pdf(self):
+        """Save content as PDF"""
+        self._save_as(
+            fmt="PDF",
+            ext="pdf",
             filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")],
-            initialdir=initial_dir,
-            initialfile=initial_file
+            export_callable=self._export_pdf,
+            failure_message="PDF export failed. Please check console for details."
         )
-        
-        if file_path:
-            self.status_var.set("Exporting to PDF...")
-            # Set wait cursor during processing
-            self.root.config(cursor="wait")
-            self.root.update()
-            
-            try:
-                orientation = self.pdf_orientation.get()
-                engine = self.pdf_engine.get()
-                
-                success = False
-                # Try WeasyPrint first if selected (Feature 6)
-                if engine == "weasyprint" and _try_import_weasyprint():
-                    success = self.converter.markdown_to_pdf_weasyprint(md_content, file_path, orientation=orientation)
-                elif engine == "browser":
-                    html = self.current_html or self.converter.markdown_to_html(md_content)
-                    success = self.converter.html_to_pdf_browser(html, file_path, orientation=orientation)
-                
-                # Fallback to ReportLab if other methods failed
-                if not success and REPORTLAB_AVAILABLE:
-                    success = self.converter.markdown_to_pdf_reportlab(md_content, file_path, orientation, keep_icons=True)
-                
-                if success:
-                    self.status_var.set(f"PDF saved: {os.path.basename(file_path)}")
-                    # Auto-open PDF if enabled
-                    if self.settings_manager.get('autoopen_enabled', True):
-                        try:
-                            os.startfile(file_path)  # Windows
-                        except AttributeError:
-                            # Unix/Linux/Mac
-                            try:
-                                subprocess.run(['xdg-open', file_path], check=False)
-                            except Exception:
-                                try:
-                                    subprocess.run(['open', file_path], check=False)  # Mac
-                                except Exception:
-                                    pass
-                    else:
-                        messagebox.showinfo("Success", f"PDF exported successfully!\n{file_path}")
-                else:
-                    self.status_var.set("PDF export failed")
-                    messagebox.showerror("Error", "PDF export failed. Please check console for details.")
-            finally:
-                # Always restore cursor
-                self.root.config(cursor="")
     
     def save_docx(self):
         """Save content as DOCX"""
+        self._save_as(
+            fmt="DOCX",
+            ext="docx",
+            filetypes=[("Word documents", "*.docx"), ("All files", "*.*")],
+            export_callable=self.converter.markdown_to_docx if self.converter else None
+        )
+    
+    def _export_pdf(self, md_content: str, file_path: str) -> bool:
+        """Export to PDF with the selected engine, falling back to ReportLab"""
+        orientation = self.pdf_orientation.get()
+        engine = self.pdf_engine.get()
+        
+        success = False
+        # Try WeasyPrint first if selected (Feature 6)
+        if engine == "weasyprint":
+            if _try_import_weasyprint():
+                success = self.converter.markdown_to_pdf_weasyprint(md_content, file_path, orientation=orientation)
+            else:
+                print("[WARNING] WeasyPrint could not be loaded, exporting with ReportLab instead")
+        elif engine == "browser":
+            html = self.converter.markdown_to_html(md_content)
+            success = self.converter.html_to_pdf_browser(html, file_path, orientation=orientation)
+        
+        # Fallback to ReportLab if other methods failed
+        if not success and REPORTLAB_AVAILABLE:
+            success = self.converter.markdown_to_pdf_reportlab(md_content, file_path, orientation, keep_icons=True)
+        return success
+    
+    def _save_as(self, *, fmt: str, ext: str, filetypes: List[Tuple[str, str]], export_callable,
+                 failure_message: Optional[str] = None):
+        """Ask for a target file, export the editor content to it and auto-open the result"""
         if not self.converter:
             messagebox.showerror("Error", "Markdown library not installed. Please install with: pip install markdown")
             return
         
-        md_content = self.text_input.get("1.0", tk.END).strip()
+        md_content = self._get_export_markdown()
         if not md_content:
             messagebox.showwarning("Warning", "No content to export!")
             return
         
-        # Determine initial directory and filename from current file or use current working directory
-        initial_dir = None
-        initial_file = None
-        if self.current_file_path:
-            initial_dir = os.path.dirname(os.path.abspath(self.current_file_path))
-            # Auto-set filename based on loaded file basename
-            base_name = os.path.splitext(os.path.basename(self.current_file_path))[0]
-            initial_file = f"{base_name}.docx"
-        elif os.path.exists(os.getcwd()):
-            initial_dir = os.getcwd()
+        initial_dir, initial_file = self._derive_save_defaults(ext)
         
         file_path = filedialog.asksaveasfilename(
-            title="Save as DOCX",
-            defaultextension=".docx",
-            filetypes=[("Word documents", "*.docx"), ("All files", "*.*")],
+            title=f"Save as {fmt}",
+            defaultextension=f".{ext}",
+            filetypes=filetypes,
             initialdir=initial_dir,
             initialfile=initial_file
         )
         
         if file_path:
-            self.status_var.set("Exporting to DOCX...")
+            self.status_var.set(f"Exporting to {fmt}...")
             # Set wait cursor during processing
             self.root.config(cursor="wait")
             self.root.update()
             
             try:
-                if self.converter.markdown_to_docx(md_content, file_path):
-                    self.status_var.set(f"DOCX saved: {os.path.basename(file_path)}")
-                    # Auto-open DOCX if enabled
+                if export_callable(md_content, file_path):
+                    self.status_var.set(f"{fmt} saved: {os.path.basename(file_path)}")
+                    # Auto-open exported file if enabled
                     if self.settings_manager.get('autoopen_enabled', True):
                         try:
-                            os.startfile(file_path)  # Windows
-                        except AttributeError:
-                            # Unix/Linux/Mac
-                            try:
-                                subprocess.run(['xdg-open', file_path], check=False)
-                            except Exception:
-                                try:
-                                    subprocess.run(['open', file_path], check=False)  # Mac
-                                except Exception:
-                                    pass
+                            _os_open(file_path)
+                        except Exception:
+                            pass
                     else:
-                        messagebox.showinfo("Success", f"DOCX exported successfully!\n{file_path}")
+                        messagebox.showinfo("Success", f"{fmt} exported successfully!\n{file_path}")
                 else:
-                    self.status_var.set("DOCX export failed")
+                    self.status_var.set(f"{fmt} export failed")
+                    if failure_message:
+                        messagebox.showerror("Error", failure_message)
             finally:
                 # Always restore cursor
                 self.root.config(cursor="")
     
     def show_settings_dialog(self):
         """Show settings dialog for optional features"""
+        # Style constants used by most widgets below, looked up once
+        bg_primary = UIColors.BG_PRIMARY
+        bg_secondary = UIColors.BG_SECONDARY
+        text_primary = UIColors.TEXT_PRIMARY
+        body_font = UIFonts.BODY
+        heading_font = UIFonts.HEADING
+        
         dialog = tk.Toplevel(self.root)
         dialog.title("Settings")
         dialog.geometry("600x500")
-        dialog.configure(bg=UIColors.BG_SECONDARY)
+        dialog.configure(bg=bg_secondary)
         dialog.transient(self.root)
         dialog.grab_set()
         dialog.lift()
@@ -3137,7 +3823,7 @@ def hello_world():
         dialog.geometry(f"+{x}+{y}")
         
         # Main frame
-        main_frame = tk.Frame(dialog, bg=UIColors.BG_SECONDARY, padx=UISpacing.MD, pady=UISpacing.MD)
+        main_frame = tk.Frame(dialog, bg=bg_secondary, padx=UISpacing.MD, pady=UISpacing.MD)
         main_frame.pack(fill='both', expand=True)
         
         # Title
@@ -3145,7 +3831,7 @@ def hello_world():
             main_frame,
             text="⚙️ Converter Settings",
             font=UIFonts.TITLE,
-            bg=UIColors.BG_SECONDARY,
+            bg=bg_secondary,
             fg=UIColors.PRIMARY
         )
         title_label.pack(pady=(0, UISpacing.LG))
@@ -3161,158 +3847,97 @@ def hello_world():
         auto_h3_var = tk.BooleanVar(value=self.settings_manager.get('auto_page_break_h3', True))
         autoopen_var = tk.BooleanVar(value=self.settings_manager.get('autoopen_enabled', True))
         
-        # Feature 2: Page Breaks
-        page_breaks_frame = tk.LabelFrame(
-            main_frame,
-            text=" Page Breaks (Feature 2) ",
-            font=UIFonts.HEADING,
-            bg=UIColors.BG_PRIMARY,
-            fg=UIColors.TEXT_PRIMARY,
-            padx=UISpacing.MD,
-            pady=UISpacing.SM
-        )
-        page_breaks_frame.pack(fill='x', pady=UISpacing.SM)
+        check_pack_options = {'anchor': 'w', 'pady': UISpacing.XS}
+        
+        def _mkframe(title):
+            frame = tk.LabelFrame(
+                main_frame,
+                text=title,
+                font=heading_font,
+                bg=bg_primary,
+                fg=text_primary,
+                padx=UISpacing.MD,
+                pady=UISpacing.SM
+            )
+            frame.pack(fill='x', pady=UISpacing.SM)
+            return frame
         
-        tk.Checkbutton(
-            page_breaks_frame,
-            text="Enable page break support",
-            variable=page_breaks_var,
-            bg=UIColors.BG_PRIMARY,
-            font=UIFonts.BODY
-        ).pack(anchor='w', pady=UISpacing.XS)
-        tk.Checkbutton(
-            page_breaks_frame,
-            text="Auto page break before numbered H2 headings (e.g., '1.', '2.')",
-            variable=auto_h2_var,
-            bg=UIColors.BG_PRIMARY,
-            font=UIFonts.BODY
-        ).pack(anchor='w', pady=UISpacing.XS)
-        tk.Checkbutton(
-            page_breaks_frame,
-            text="Auto page break before numbered H3 sub-sections (e.g., '1.1', '2.3')",
-            variable=auto_h3_var,
-            bg=UIColors.BG_PRIMARY,
-            font=UIFonts.BODY
-        ).pack(anchor='w', pady=UISpacing.XS)
+        def _mkcheck(parent, text, var):
+            check = tk.Checkbutton(parent, text=text, variable=var, bg=bg_primary, font=body_font)
+            check.pack(**check_pack_options)
+            return check
         
-        # Feature 3: Preprocessing
-        preprocessing_frame = tk.LabelFrame(
-            main_frame,
-            text=" Content Preprocessing (Feature 3) ",
-            font=UIFonts.HEADING,
-            bg=UIColors.BG_PRIMARY,
-            fg=UIColors.TEXT_PRIMARY,
-            padx=UISpacing.MD,
-            pady=UISpacing.SM
-        )
-        preprocessing_frame.pack(fill='x', pady=UISpacing.SM)
+        # Feature 2: Page Breaks
+        page_breaks_frame = _mkframe(" Page Breaks (Feature 2) ")
+        _mkcheck(page_breaks_frame, "Enable page break support", page_breaks_var)
+        _mkcheck(page_breaks_frame, "Auto page break before numbered H2 headings (e.g., '1.', '2.')", auto_h2_var)
+        _mkcheck(page_breaks_frame, "Auto page break before numbered H3 sub-sections (e.g., '1.1', '2.3')", auto_h3_var)
         
-        tk.Checkbutton(
-            preprocessing_frame,
-            text="Remove horizontal rules (---, ***) and normalize line breaks",
-            variable=preprocessing_var,
-            bg=UIColors.BG_PRIMARY,
-            font=UIFonts.BODY
-        ).pack(anchor='w', pady=UISpacing.XS)
+        # Feature 3: Preprocessing
+        preprocessing_frame = _mkframe(" Content Preprocessing (Feature 3) ")
+        _mkcheck(preprocessing_frame, "Remove horizontal rules (---, ***) and normalize line breaks", preprocessing_var)
         
         # Feature 4: Advanced DOCX
-        docx_frame = tk.LabelFrame(
-            main_frame,
-            text=" Advanced DOCX Features (Feature 4) ",
-            font=UIFonts.HEADING,
-            bg=UIColors.BG_PRIMARY,
-            fg=UIColors.TEXT_PRIMARY,
-            padx=UISpacing.MD,
-            pady=UISpacing.SM
-        )
-        docx_frame.pack(fill='x', pady=UISpacing.SM)
-        
-        tk.Checkbutton(
-            docx_frame,
-            text="Enable advanced DOCX features (bookmarks, hyperlinks, formatting)",
-            variable=advanced_docx_var,
-            bg=UIColors.BG_PRIMARY,
-            font=UIFonts.BODY
-        ).pack(anchor='w', pady=UISpacing.XS)
-        tk.Checkbutton(
-            docx_frame,
-            text="Use narrow margins (0.5 inch) in DOCX",
-            variable=narrow_margins_var,
-            bg=UIColors.BG_PRIMARY,
-            font=UIFonts.BODY
-        ).pack(anchor='w', pady=UISpacing.XS)
+        docx_frame = _mkframe(" Advanced DOCX Features (Feature 4) ")
+        _mkcheck(docx_frame, "Enable advanced DOCX features (bookmarks, hyperlinks, formatting)", advanced_docx_var)
+        _mkcheck(docx_frame, "Use narrow margins (0.5 inch) in DOCX", narrow_margins_var)
         
         # Feature 5: Font Size
-        font_frame = tk.LabelFrame(
-            main_frame,
-            text=" Font Size Options (Feature 5) ",
-            font=UIFonts.HEADING,
-            bg=UIColors.BG_PRIMARY,
-            fg=UIColors.TEXT_PRIMARY,
-            padx=UISpacing.MD,
-            pady=UISpacing.SM
-        )
-        font_frame.pack(fill='x', pady=UISpacing.SM)
-        
-        tk.Checkbutton(
-            font_frame,
-            text="Enable font size options",
-            variable=font_size_var,
-            bg=UIColors.BG_PRIMARY,
-            font=UIFonts.BODY
-        ).pack(anchor='w', pady=UISpacing.XS)
+        font_frame = _mkframe(" Font Size Options (Feature 5) ")
+        _mkcheck(font_frame, "Enable font size options", font_size_var)
         
-        font_size_frame = tk.Frame(font_frame, bg=UIColors.BG_PRIMARY)
+        font_size_frame = tk.Frame(font_frame, bg=bg_primary)
         font_size_frame.pack(anchor='w', padx=UISpacing.LG, pady=UISpacing.XS)
-        tk.Label(font_size_frame, text="Default font size:", bg=UIColors.BG_PRIMARY, font=UIFonts.BODY).pack(side='left', padx=UISpacing.SM)
+        tk.Label(font_size_frame, text="Default font size:", bg=bg_primary, font=body_font).pack(side='left', padx=UISpacing.SM)
         for size in [9, 10, 11, 12, 14]:
             tk.Radiobutton(
                 font_size_frame,
                 text=f"{size}pt",
                 variable=font_size_value,
                 value=size,
-                bg=UIColors.BG_PRIMARY,
-                font=UIFonts.BODY
+                bg=bg_primary,
+                font=body_font
             ).pack(side='left', padx=UISpacing.XS)
         
         # Auto-open settings
-        autoopen_frame = tk.LabelFrame(
-            main_frame,
-            text=" Export Options ",
-            font=UIFonts.HEADING,
-            bg=UIColors.BG_PRIMARY,
-            fg=UIColors.TEXT_PRIMARY,
-            padx=UISpacing.MD,
-            pady=UISpacing.SM
-        )
-        autoopen_frame.pack(fill='x', pady=UISpacing.SM)
-        
-        tk.Checkbutton(
-            autoopen_frame,
-            text="Automatically open PDF/DOCX after generation",
-            variable=autoopen_var,
-            bg=UIColors.BG_PRIMARY,
-            font=UIFonts.BODY
-        ).pack(anchor='w', pady=UISpacing.XS)
+        autoopen_frame = _mkframe(" Export Options ")
+        _mkcheck(autoopen_frame, "Automatically open PDF/DOCX after generation", autoopen_var)
         
         # Buttons
-        button_frame = tk.Frame(main_frame, bg=UIColors.BG_SECONDARY)
+        button_frame = tk.Frame(main_frame, bg=bg_secondary)
         button_frame.pack(fill='x', pady=(UISpacing.LG, 0))
         
         def save_settings():
-            self.settings_manager.set('page_breaks_enabled', page_breaks_var.get())
-            self.settings_manager.set('preprocessing_enabled', preprocessing_var.get())
-            self.settings_manager.set('advanced_docx_enabled', advanced_docx_var.get())
-            self.settings_manager.set('font_size_options_enabled', font_size_var.get())
-            self.settings_manager.set('default_font_size', font_size_value.get())
-            self.settings_manager.set('docx_narrow_margins', narrow_margins_var.get())
-            self.settings_manager.set('auto_page_break_h2', auto_h2_var.get())
-            self.settings_manager.set('auto_page_break_h3', auto_h3_var.get())
-            self.settings_manager.set('autoopen_enabled', autoopen_var.get())
+            new_values = {
+                'page_breaks_enabled': page_breaks_var.get(),
+                'preprocessing_enabled': preprocessing_var.get(),
+                'advanced_docx_enabled': advanced_docx_var.get(),
+                'font_size_options_enabled': font_size_var.get(),
+                'default_font_size': font_size_value.get(),
+                'docx_narrow_margins': narrow_margins_var.get(),
+                'auto_page_break_h2': auto_h2_var.get(),
+                'auto_page_break_h3': auto_h3_var.get(),
+                'autoopen_enabled': autoopen_var.get(),
+            }
+            changed = {key: value for key, value in new_values.items() if self.settings_manager.get(key) != value}
+            if not changed:
+                # Nothing toggled - keep the settings file and preview caches as they are
+                dialog.destroy()
+                return
+            for key, value in changed.items():
+                self.settings_manager.set(key, value)
             
             # Update converter settings
             if self.converter:
                 self.converter.settings = self.settings_manager
+            # Cached preview blocks were rendered with the previous settings
+            with self._render_lock:
+                self._block_cache = {}
+            self._last_md_key = None
+            self._preview_html_cache = {}
+            # Drop conversions still running with the old settings and re-render with the new ones
+            self._preview_gen += 1
+            self.update_preview()
             
             self.settings_manager.save_settings()
             dialog.destroy()
@@ -3324,6 +3949,7 @@ def hello_world():
     def on_closing(self):
         """Handle window closing - save settings"""
         self.settings_manager.save_settings()
+        self._render_executor.shutdown(wait=False)
         self.root.destroy()
     
     def open_in_browser(self):
@@ -3333,6 +3959,7 @@ def hello_world():
             return
         
         try:
+            html = self._get_full_html()
             if not self.browser_preview_path:
                 temp_dir = tempfile.gettempdir()
                 self.browser_preview_path = os.path.join(temp_dir, "md_converter_live_preview.html")
@@ -3345,8 +3972,18 @@ def hello_world():
                         pass
                 atexit.register(_cleanup)
             
-            with open(self.browser_preview_path, "w", encoding="utf-8") as f:
-                f.write(self.current_html)
+            html_bytes = html.encode("utf-8")
+            html_hash = hashlib.blake2b(html_bytes, digest_size=16).digest()
+            if html_hash == self._last_browser_html_hash and os.path.exists(self.browser_preview_path):
+                # Unchanged document - only bump the mtime for browsers that reload on change
+                os.utime(self.browser_preview_path, None)
+            else:
+                # Swap the file in atomically so a reloading browser never sees half of it
+                temp_path = self.browser_preview_path + ".tmp"
+                with open(temp_path, "wb") as f:
+                    f.write(html_bytes)
+                os.replace(temp_path, self.browser_preview_path)
+                self._last_browser_html_hash = html_hash
             
             file_url = Path(self.browser_preview_path).absolute().as_uri()
             webbrowser.open(file_url)
@@ -3362,6 +3999,9 @@ def hello_world():
 
 def install_missing_dependencies():
     """Automatically install missing dependencies"""
+    if MARKDOWN_AVAILABLE and TKINTERWEB_AVAILABLE and DOCX_AVAILABLE and REPORTLAB_AVAILABLE:
+        return True
+    
     missing_deps = []
     
     if not MARKDOWN_AVAILABLE: